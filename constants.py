@@ -126,6 +126,10 @@ RESOURCES_DIR = BASE_DIR / "resources"
 LOGO_PATH = RESOURCES_DIR / "Logo.png"
 ICON_PATH = RESOURCES_DIR / "icon.ico"
 
+# Logo-Höhe im Über-Dialog (Pixel) und QPixmapCache-Schlüssel des skalierten Logos
+ABOUT_LOGO_HEIGHT_PX = 128
+ABOUT_LOGO_CACHE_KEY = f"about_logo_{ABOUT_LOGO_HEIGHT_PX}"
+
 # ================================================================================================
 # DRUCK-PARAMETER (Legacy - für Rückwärtskompatibilität)
 # ================================================================================================
@@ -182,6 +186,15 @@ TEXT_BUFFER_FACTOR = 1.5  # Buffer-Faktor fuer Text-Hoehe (wird nicht mehr verwe
 # SYSTEM: Konstanten fuer Font-Berechnungen (unveränderlich)
 SYSTEM_POINTS_PER_INCH = 72  # Standard: 1 Point = 1/72 Inch
 POINTS_PER_INCH = SYSTEM_POINTS_PER_INCH  # Alias für Rückwärtskompatibilität
+MM_PER_INCH = 25.4  # 1 Inch = 25.4 mm
+
+# Näherungswerte für Font-Metrics (Anteil der Schriftgröße), falls die Schriftart
+# keine verwertbaren Metriken liefert (GUI-Vorschau der max. Grafikgröße)
+FONT_ASCENT_RATIO = 0.8
+FONT_DESCENT_RATIO = 0.2
+
+# Referenz-Pixelgröße zum Auslesen der Font-Metrics (Verhältnisse sind größen- und DPI-unabhängig)
+FONT_METRICS_REF_PX = 1000
 
 # Grafik-Positionierung
 # "top" = oben, "center" = mittig, "bottom" = unten
@@ -401,6 +414,9 @@ BLANKO_S1_ZEICHEN_NAMEN = {
     BLANKO_S1_LINIEN_STAERKE: "S1 mit Linien + Staerke"
 }
 
+# PERFORMANCE: Cache-Größe für Blanko-Erkennung pro SVG-Pfad (SVGLoaderLocal, lru_cache)
+BLANKO_LOOKUP_CACHE_SIZE = 4096
+
 # ================================================================================================
 # SVG-OPTIONEN
 # ===============================================================================================
@@ -623,8 +639,20 @@ VALIDATION_NORMAL_BG = "white"     # Weiss - Normaler Hintergrund
 # GUI PERFORMANCE - BATCH-UPDATE-INTERVALL
 # ================================================================================================
 
-# GUI-Update-Intervall beim Tree-Aufbau (alle X Items)
-GUI_BATCH_UPDATE_INTERVAL = 100  # UI-Update alle 100 Items
+# GUI-Update-Intervall beim Tree-Aufbau (Mindestabstand zwischen processEvents()-Aufrufen)
+GUI_PROCESS_EVENTS_INTERVAL_MS = 50  # UI-Update hoechstens alle 50 ms
+
+# Maximale Breite des Fortschrittsbalkens in der Statusleiste (Pixel)
+GUI_PROGRESS_BAR_MAX_WIDTH = 200
+
+# Entprell-Zeit fuer Validierungs-Warnungen (Flag-Reset nach X ms)
+VALIDATION_WARNING_RESET_MS = 500
+
+# Entprell-Zeit fuer die gesammelte Validierung nach Modus-Wechseln (ms)
+VALIDATION_DEBOUNCE_MS = 150
+
+# Entprell-Zeit fuer die Suche im Zeichen-Baum (Filter erst nach Tipp-Pause)
+SEARCH_DEBOUNCE_MS = 150
 
 # ================================================================================================
 # GRAFIK-GROESSE (DYNAMISCH BERECHNET)
@@ -674,7 +702,7 @@ def mm_to_pixels(mm: float, dpi: int = DEFAULT_DPI) -> int:
     Returns:
         Wert in Pixel (gerundet)
     """
-    inches = mm / 25.4
+    inches = mm / MM_PER_INCH
     pixels = inches * dpi
     return int(round(pixels))
 
@@ -691,7 +719,7 @@ def pixels_to_mm(pixels: int, dpi: int = DEFAULT_DPI) -> float:
         Wert in Millimeter
     """
     inches = pixels / dpi
-    mm = inches * 25.4
+    mm = inches * MM_PER_INCH
     return mm
 
 
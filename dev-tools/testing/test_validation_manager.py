@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_validation_manager.py - Unit-Tests fuer die Textlaengen-Validierung
+
+Testet ValidationManager.validate_text_lengths_batch() gegen die
+Einzel-Validierung validate_text_length():
+- Batch-Ergebnisse identisch mit Einzel-Ergebnissen (gleiche Reihenfolge)
+- Doppelte (modus, text)-Paare mit unterschiedlichen Item-Namen
+- Zu breiter Text (Fehlermeldung "zu BREIT")
+- Zu hoher Text (Fehlermeldung "zu HOCH")
+
+HINWEIS: TEXT_LENGTH_VALIDATION_ENABLED ist in constants.py deaktiviert,
+die Tests schalten die Validierung im Modul validation_manager temporaer ein.
+
+Ausfuehrung: python dev-tools/testing/test_validation_manager.py
+Version: 1.0
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import from modules
+import validation_manager
+from validation_manager import ValidationManager
+
+
+# Zeichen 45 x 45 mm: kurze Texte passen, "X" * 300 ist zu breit
+GEOMETRIE_STANDARD = dict(zeichen_hoehe_mm=45, zeichen_breite_mm=45, sicherheitsabstand_mm=3, font_size=10)
+
+# Zeichen 12 x 200 mm: sicherer Bereich nur 6 mm hoch -> jeder Text ist zu hoch
+GEOMETRIE_FLACH = dict(zeichen_hoehe_mm=12, zeichen_breite_mm=200, sicherheitsabstand_mm=3, font_size=10)
+
+
+def print_section(title: str):
+    """Formatierte Sektion-Ueberschrift ausgeben"""
+    print("\n" + "=" * 70)
+    print(title)
+    print("=" * 70)
+
+
+def print_test(test_name: str):
+    """Formatierte Test-Ueberschrift ausgeben"""
+    print("\n[TEST] {}".format(test_name))
+
+
+@contextmanager
+def validation_enabled():
+    """Schaltet die Textlaengen-Validierung fuer die Dauer des Blocks ein"""
+    previous = validation_manager.TEXT_LENGTH_VALIDATION_ENABLED
+    validation_manager.TEXT_LENGTH_VALIDATION_ENABLED = True
+    try:
+        yield
+    finally:
+        validation_manager.TEXT_LENGTH_VALIDATION_ENABLED = previous
+
+
+def validate_single(vm: ValidationManager, entries: list, geometrie: dict) -> list:
+    """Validiert alle Eintraege einzeln ueber validate_text_length()"""
+    return [
+        vm.validate_text_length(text=text, modus=modus, item_name=item_name, **geometrie)
+        for text, modus, item_name in entries
+    ]
+
+
+def test_batch_matches_single():
+    """
+    Test 1: Batch- und Einzel-Validierung liefern identische Ergebnisse
+
+    Enthaelt doppelte (modus, text)-Paare mit unterschiedlichen Item-Namen
+    (Text wird nur einmal gemessen, Fehlermeldung nennt trotzdem das jeweilige Item)
+    """
+    print_test("validate_text_lengths_batch() == validate_text_length()")
+
+    entries = [
+        ("OV Musterstadt", "ov_staerke", "Zeichen A"),
+        ("kurz", "freitext", "Zeichen B"),
+        ("X" * 300, "freitext", "Zeichen C"),
+        ("kurz", "freitext", "Zeichen D"),       # Duplikat von B
+        ("X" * 300, "freitext", "Zeichen E"),    # Duplikat von C
+        ("Ruf 1", "ruf", "Zeichen F"),
+    ]
+
+    with validation_enabled():
+        vm = ValidationManager()
+        for geometrie in (GEOMETRIE_STANDARD, GEOMETRIE_FLACH):
+            single = validate_single(vm, entries, geometrie)
+            batch = vm.validate_text_lengths_batch(entries, **geometrie)
+
+            assert batch == single, (
+                "FEHLER: Batch weicht von Einzel-Validierung ab!\n"
+                "Einzel: {}\n"
+                "Batch: {}"
+            ).format(single, batch)
+
+    print("  [OK] {} Eintraege identisch (inkl. Duplikate)".format(len(entries)))
+    return True
+
+
+def test_batch_duplicate_item_names():
+    """
+    Test 2: Doppelte Texte melden jeweils den eigenen Item-Namen
+    """
+    print_test("Duplikate mit eigenem Item-Namen")
+
+    entries = [
+        ("X" * 300, "freitext", "Zeichen C"),
+        ("X" * 300, "freitext", "Zeichen E"),
+    ]
+
+    with validation_enabled():
+        results = ValidationManager().validate_text_lengths_batch(entries, **GEOMETRIE_STANDARD)
+
+    assert [r[0] for r in results] == [False, False], "FEHLER: Zu langer Text nicht erkannt: {}".format(results)
+    assert "'Zeichen C'" in results[0][1] and "'Zeichen E'" in results[1][1], (
+        "FEHLER: Fehlermeldung nennt falsches Item!\n{}\n{}"
+    ).format(results[0][1], results[1][1])
+
+    print("  [OK] Fehlermeldungen nennen 'Zeichen C' und 'Zeichen E'")
+    return True
+
+
+def test_batch_too_wide():
+    """
+    Test 3: Zu breiter Text wird als "zu BREIT" gemeldet
+    """
+    print_test("Zu breiter Text")
+
+    entries = [("kurz", "freitext", "OK"), ("X" * 300, "freitext", "Breit")]
+
+    with validation_enabled():
+        results = ValidationManager().validate_text_lengths_batch(entries, **GEOMETRIE_STANDARD)
+
+    assert results[0] == (True, None), "FEHLER: Kurzer Text abgelehnt: {}".format(results[0])
+    assert results[1][0] is False and "zu BREIT" in results[1][1], (
+        "FEHLER: Erwartet 'zu BREIT', erhalten: {}"
+    ).format(results[1])
+
+    print("  [OK] Zu breiter Text erkannt")
+    return True
+
+
+def test_batch_too_high():
+    """
+    Test 4: Zu hoher Text wird als "zu HOCH" gemeldet
+    """
+    print_test("Zu hoher Text")
+
+    entries = [("kurz", "freitext", "Hoch")]
+
+    with validation_enabled():
+        results = ValidationManager().validate_text_lengths_batch(entries, **GEOMETRIE_FLACH)
+
+    assert results[0][0] is False and "zu HOCH" in results[0][1], (
+        "FEHLER: Erwartet 'zu HOCH', erhalten: {}"
+    ).format(results[0])
+
+    print("  [OK] Zu hoher Text erkannt")
+    return True
+
+
+def test_batch_disabled():
+    """
+    Test 5: Deaktivierte Validierung laesst alle Eintraege durch
+    """
+    print_test("Validierung deaktiviert")
+
+    entries = [("X" * 300, "freitext", "Breit"), ("kurz", "freitext", "OK")]
+
+    previous = validation_manager.TEXT_LENGTH_VALIDATION_ENABLED
+    validation_manager.TEXT_LENGTH_VALIDATION_ENABLED = False
+    try:
+        results = ValidationManager().validate_text_lengths_batch(entries, **GEOMETRIE_STANDARD)
+    finally:
+        validation_manager.TEXT_LENGTH_VALIDATION_ENABLED = previous
+
+    assert results == [(True, None), (True, None)], "FEHLER: {}".format(results)
+
+    print("  [OK] Alle Eintraege gueltig")
+    return True
+
+
+def run_all_tests():
+    """Fuehrt alle Tests aus und gibt Zusammenfassung aus"""
+    print_section("VALIDATION-MANAGER UNIT TESTS (v1.0)")
+    print("Testet validate_text_lengths_batch() gegen validate_text_length()")
+
+    tests = [
+        test_batch_matches_single,
+        test_batch_duplicate_item_names,
+        test_batch_too_wide,
+        test_batch_too_high,
+        test_batch_disabled,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test_func in tests:
+        try:
+            if test_func():
+                passed += 1
+        except AssertionError as e:
+            print("\n[FEHLER] Test fehlgeschlagen:")
+            print(str(e))
+            failed += 1
+        except Exception as e:
+            print("\n[FEHLER] Unerwarteter Fehler:")
+            print(str(e))
+            failed += 1
+
+    # Zusammenfassung
+    print_section("ZUSAMMENFASSUNG")
+    print("Tests bestanden: {}".format(passed))
+    print("Tests fehlgeschlagen: {}".format(failed))
+    print("Gesamt: {}".format(len(tests)))
+
+    if failed == 0:
+        print("\n[OK] Alle Tests bestanden!")
+        return 0
+    else:
+        print("\n[FEHLER] {} Test(s) fehlgeschlagen!".format(failed))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_all_tests())
@@ -13,7 +13,7 @@ Features:
 from pathlib import Path
 from typing import List
 from PyQt6.QtWidgets import QDialog, QFileDialog, QMessageBox, QLabel
-from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer
+from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer, QSignalBlocker
 from PyQt6.QtGui import QPixmap
 
 from logging_manager import LoggingManager
@@ -454,6 +454,14 @@ class ExportDialog(QDialog):
         # UI laden
         UILoader().load_ui("export_dialog.ui", self)
 
+        # Ausgangszustand aus der .ui-Datei merken (für reset())
+        self._ui_defaults = (
+            self.chk_schnittlinien.isChecked(),
+            self.check_ordner_oeffnen.isChecked(),
+            self.spin_threads.value(),
+            self.btn_abbrechen.text()
+        )
+
         # Logo hinzufuegen
         self._add_logo_widget()
 
@@ -463,6 +471,55 @@ class ExportDialog(QDialog):
 
         self.logger.info(f"Export-Dialog geöffnet: {len(zeichen_items)} Zeichen")
 
+    def reset(self, zeichen_items: List[ZeichenTreeItem], settings, active_layout: str = "s2"):
+        """
+        Bereitet den Dialog für einen neuen Export vor (ohne UI neu aufzubauen)
+
+        PERFORMANCE: Das MainWindow erstellt den Dialog nur einmal und ruft vor
+        jedem weiteren exec() reset() auf. Daten werden neu gebunden, alle
+        Widgets in den Zustand eines frisch geöffneten Dialogs versetzt.
+
+        Args:
+            zeichen_items: Liste von ausgewählten ZeichenTreeItem
+            settings: AppSettings mit globalen Einstellungen
+            active_layout: Aktives Layout ("s1" oder "s2", default: "s2")
+        """
+        self.zeichen_items = zeichen_items
+        self.settings = settings
+        self.active_layout = active_layout
+        self.worker = None
+        self.actual_output_dir = None
+        self.export_successful = False
+
+        schnittlinien, ordner_oeffnen, threads, abbrechen_text = self._ui_defaults
+
+        # Schnittlinien-Info nur bei Benutzer-Klick anzeigen, nicht beim Zurücksetzen
+        with QSignalBlocker(self.chk_schnittlinien):
+            self.chk_schnittlinien.setChecked(schnittlinien)
+        self.check_ordner_oeffnen.setChecked(ordner_oeffnen)
+        self.spin_threads.setValue(threads)
+
+        # Bedienelemente freigeben, Fortschritt/Nach-Export-Elemente ausblenden
+        for widget in (self.btn_exportieren, self.btn_ordner_waehlen, self.combo_format,
+                       self.combo_dpi, self.spin_threads, self.check_ordner_oeffnen):
+            widget.setEnabled(True)
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(False)
+        self.label_status.setVisible(False)
+        self.btn_ordner_oeffnen_nach_export.setVisible(False)
+        self.btn_abbrechen.setText(abbrechen_text)
+        self.btn_exportieren.setFocus()
+
+        # Ordner, DPI, Format und Zusammenfassung wie beim Erstellen setzen
+        self._init_ui()
+
+        self.logger.info(f"Export-Dialog geöffnet: {len(zeichen_items)} Zeichen")
+
+    def is_export_running(self) -> bool:
+        """Gibt zurück ob noch ein Export-Worker läuft"""
+        return self.worker is not None and self.worker.isRunning()
+
     def _add_logo_widget(self):
         """Laedt Logo in das label_logo Widget (definiert in .ui-Datei)"""
         if not LOGO_PATH.exists():
@@ -11,7 +11,7 @@ NEW (v7.3): Settings Dialog implementiert
 
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import os
 import shutil
 
@@ -57,9 +57,15 @@ class SettingsDialog(QDialog):
         self.settings = settings_mgr.load_settings()  # AppSettings Objekt laden
         self.logger = LoggingManager().get_logger(__name__)
 
+        # Zuletzt in combo_font eingetragene Schriften
+        self._font_families: List[str] = []
+
         # UI laden
         self._load_ui()
 
+        # Start-Tab aus der .ui-Datei merken (für reset())
+        self._initial_tab_index = self.tabWidget.currentIndex()
+
         # Werte aus settings.json laden
         self._load_values()
 
@@ -68,6 +74,19 @@ class SettingsDialog(QDialog):
 
         self.logger.info("SettingsDialog initialisiert")
 
+    def reset(self):
+        """
+        Bereitet den Dialog für erneutes Öffnen vor (ohne UI neu aufzubauen)
+
+        PERFORMANCE: Das MainWindow erstellt den Dialog nur einmal und ruft vor
+        jedem weiteren exec() reset() auf - Einstellungen werden neu geladen und
+        in die bestehenden Widgets geschrieben.
+        """
+        self.settings = self.settings_mgr.load_settings()
+        self.tabWidget.setCurrentIndex(self._initial_tab_index)
+        self._load_values()
+        self.logger.debug("SettingsDialog zurückgesetzt")
+
     def _load_ui(self):
         """Lädt die UI-Datei"""
         ui_path = Path(__file__).parent.parent / "ui_files" / "settings_dialog.ui"
@@ -93,8 +112,11 @@ class SettingsDialog(QDialog):
             # Schrift
             # PyQt6: families() ist eine statische Methode
             available_fonts = QFontDatabase.families()
-            self.combo_font.clear()
-            self.combo_font.addItems(available_fonts)
+            # PERFORMANCE: Liste nur neu befüllen wenn sich die Schriften geändert haben (reset())
+            if available_fonts != self._font_families:
+                self.combo_font.clear()
+                self.combo_font.addItems(available_fonts)
+                self._font_families = available_fonts
 
             # Aktuellen Font auswählen (aus settings.json, sonst DEFAULT_FONT_FAMILY)
             current_font = self.settings.zeichen.font_family
@@ -12,24 +12,38 @@ Features:
 - Vorschaubilder optional
 """
 
+import os
+import platform
+import subprocess
 import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterator
 from PyQt6.QtWidgets import (
     QMainWindow, QMessageBox, QFileDialog, QDialog,
     QComboBox, QLineEdit, QDoubleSpinBox, QSpinBox, QTreeWidgetItem,
-    QTreeWidget, QPushButton, QCheckBox, QLabel, QStatusBar
+    QTreeWidget, QPushButton, QCheckBox, QLabel, QStatusBar, QApplication, QProgressBar
+)
+from PyQt6.QtCore import Qt, QTimer, QSignalBlocker, QElapsedTimer, QUrl, QEvent
+from PyQt6.QtGui import (  # NEW: QPixmap und QIcon fuer Logo/Icon
+    QColor, QBrush, QAction, QPixmap, QPixmapCache, QIcon, QStandardItemModel, QStandardItem, QDesktopServices,
+    QFont, QFontMetricsF
 )
-from PyQt6.QtCore import Qt, QTimer, QEvent, QObject
-from PyQt6.QtGui import QColor, QBrush, QAction, QPixmap, QIcon  # NEW: QPixmap und QIcon fuer Logo/Icon
 
 from logging_manager import LoggingManager
 from constants import (
     PROGRAM_NAME, PROGRAM_VERSION, PROGRAM_DESCRIPTION, PROGRAM_AUTHOR, PROGRAM_AUTHOR_EMAIL, DEFAULT_ZEICHEN_DIR,
-    VALIDATION_ERROR_BG, VALIDATION_ERROR_FG, VALIDATION_NORMAL_BG, GUI_BATCH_UPDATE_INTERVAL,
-    LOGO_PATH, ICON_PATH,
+    VALIDATION_ERROR_BG, VALIDATION_ERROR_FG,
+    VALIDATION_WARNING_RESET_MS, VALIDATION_DEBOUNCE_MS, SEARCH_DEBOUNCE_MS, GUI_PROCESS_EVENTS_INTERVAL_MS,
+    GUI_PROGRESS_BAR_MAX_WIDTH,
+    LOGO_PATH, ICON_PATH, EXPORT_DIR, LOGS_DIR, ABOUT_LOGO_HEIGHT_PX, ABOUT_LOGO_CACHE_KEY,
     DEFAULT_ASPECT_LOCKED, DEFAULT_AUTO_ADJUST_GRAFIK_SIZE, DEFAULT_AUTO_ADJUST_FONT_SIZE,
-    DEFAULT_S1_LINKS_PROZENT, DEFAULT_S1_ANZAHL_SCHREIBLINIEN, DEFAULT_S1_ASPECT_LOCKED, DEFAULT_S1_STAERKE_ANZEIGEN
+    DEFAULT_S1_LINKS_PROZENT, DEFAULT_S1_ANZAHL_SCHREIBLINIEN, DEFAULT_S1_ASPECT_LOCKED, DEFAULT_S1_STAERKE_ANZEIGEN,
+    LINE_HEIGHT_FACTOR, SYSTEM_POINTS_PER_INCH, POINTS_PER_INCH, MM_PER_INCH, FONT_ASCENT_RATIO, FONT_DESCENT_RATIO,
+    FONT_METRICS_REF_PX
 )
 from settings_manager import SettingsManager, AppSettings
 from runtime_config import get_config
@@ -45,27 +59,58 @@ from gui.modus_config import (  # NEW: Zentrale Modi-Konfiguration
     get_placeholder_text
 )
 from validation_manager import ValidationManager  # NEW
+from font_manager import FontManager
+from gui.dialogs.settings_dialog import SettingsDialog
+
+# Cursor-Tasten, die bei Tree-Widgets ohne Focus keine Werte ändern dürfen
+NO_SCROLL_BLOCKED_KEYS = frozenset((Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right))
+
+# PERFORMANCE: Umrechnungsfaktoren mm <-> pt, einmalig berechnet
+_PT_PER_MM = SYSTEM_POINTS_PER_INCH / MM_PER_INCH
+_MM_PER_PT = MM_PER_INCH / POINTS_PER_INCH
+
+
+class NoScrollSpinBox(QSpinBox):
+    """
+    SpinBox ohne Scrollrad und Cursor-Tasten (ohne Focus)
+
+    Verhindert ungewollte Änderungen durch Scrollen oder Pfeiltasten.
+    CHANGED: Ersetzt NoScrollWheelFilter - ein Python-EventFilter pro Widget wurde
+    für JEDES Event aufgerufen (Paint, Enter, ...), die Überschreibung nur für Wheel/KeyPress.
+    """
+    def wheelEvent(self, e):
+        e.accept()  # Event verschlucken (kein Wertwechsel, kein Weiterreichen)
 
-class NoScrollWheelFilter(QObject):
+    def keyPressEvent(self, e):
+        if not self.hasFocus() and e.key() in NO_SCROLL_BLOCKED_KEYS:
+            e.accept()
+            return
+        super().keyPressEvent(e)
+
+
+class NoScrollComboBox(QComboBox):
     """
-    Event-Filter um Scrollrad und Cursor-Tasten für ComboBox/SpinBox zu blockieren
+    ComboBox ohne Scrollrad und Cursor-Tasten (ohne Focus)
 
-    Verhindert ungewollte Änderungen durch Scrollen oder Pfeiltasten
+    Siehe NoScrollSpinBox.
     """
-    def eventFilter(self, a0, a1):  # CHANGED: Parameter-Namen an QObject.eventFilter angepasst
-        obj, event = a0, a1  # Lokale Variablen für bessere Lesbarkeit
+    def wheelEvent(self, e):
+        e.accept()  # Event verschlucken (kein Wertwechsel, kein Weiterreichen)
+
+    def keyPressEvent(self, e):
+        if not self.hasFocus() and e.key() in NO_SCROLL_BLOCKED_KEYS:
+            e.accept()
+            return
+        super().keyPressEvent(e)
 
-        # Scrollrad-Event blockieren
-        if event.type() == QEvent.Type.Wheel:
-            return True  # Event blockieren
+# Dateiname-Modus: Unterstriche -> Leerzeichen (str.translate-Tabelle)
+_UNDERSCORE_TRANS = str.maketrans('_', ' ')
 
-        # Cursor-Tasten blockieren (nur wenn Widget keinen Focus hat)
-        if event.type() == QEvent.Type.KeyPress and not obj.hasFocus():
-            key = event.key()
-            if key in [Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_Left, Qt.Key.Key_Right]:
-                return True  # Event blockieren
+# Modi ohne Text - Textfeld deaktiviert (PERFORMANCE: frozenset statt Listen-Literal pro Aufruf)
+_DISABLED_TEXT_MODES = frozenset(("ohne_text", "schreiblinie_staerke"))
 
-        return False  # Event durchlassen
+# Sortier-Key für angehakte Zeichen (Tree-Reihenfolge)
+_TREE_INDEX_KEY = attrgetter('_tree_index')
 
 def filemanager():
     """Dateimanager je nach Plattform auswählen"""
@@ -91,7 +136,8 @@ class MainWindow(QMainWindow):
     """
 
     # NEW: Modi die Text haben (alle außer ohne_text und schreiblinie_staerke)
-    TEXT_MODES = ["ov_staerke", "ort_staerke", "freitext", "dateiname", "ruf"]
+    # PERFORMANCE: frozenset für O(1)-Membership-Tests in den Validierungs-Schleifen
+    TEXT_MODES = frozenset(("ov_staerke", "ort_staerke", "freitext", "dateiname", "ruf"))
 
     # NEW: Stub-Attribute für .ui-Widgets (Type-Hints für Pylance)
     tree_zeichen: QTreeWidget
@@ -168,21 +214,104 @@ class MainWindow(QMainWindow):
 
         self.logger = LoggingManager().get_logger(__name__)
 
+        # PERFORMANCE: RuntimeConfig-Singleton einmal holen (statt get_config() pro Aufruf),
+        # wird in _on_einstellungen nach reload_from_settings() aktualisiert
+        self._runtime_cfg = get_config()
+
         # NEW: Flag für Batch-Operationen (unterdrückt Einzelwarnungen)
         self._batch_operation_active = False
 
         # NEW: Flag um mehrfache Warnungen zu verhindern
         self._validation_warning_shown = False
-        self._validation_warning_timer = None  # FIXED: Timer um Flag zu resetten
+        # PERFORMANCE: Ein persistenter Single-Shot-Timer statt Neuanlage bei jedem Reset
+        self._validation_warning_timer = QTimer(self)
+        self._validation_warning_timer.setSingleShot(True)
+        self._validation_warning_timer.setInterval(VALIDATION_WARNING_RESET_MS)
+        self._validation_warning_timer.timeout.connect(self._reset_validation_warning_flag)
+
+        # PERFORMANCE: Gesammelte Validierung nach Modus-Wechseln (entprellt, ein Durchlauf)
+        # Schlüssel: id(item) - QTreeWidgetItem ist nicht hashbar
+        self._pending_validation: Dict[int, ZeichenTreeItem] = {}
+        self._validation_debouncer = QTimer(self)
+        self._validation_debouncer.setSingleShot(True)
+        self._validation_debouncer.setInterval(VALIDATION_DEBOUNCE_MS)
+        self._validation_debouncer.timeout.connect(self._flush_validation)
+
+        # PERFORMANCE: Rot markierte Zeichen (id -> Item, gepflegt in _highlight_row) -
+        # Grundlage für _revalidate_ancestors() statt kompletter Neuvalidierung
+        self._invalid_leaves: Dict[int, ZeichenTreeItem] = {}
+
+        # PERFORMANCE: Suche entprellt - ein Filter-Durchlauf nach der Tipp-Pause statt pro Taste
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._apply_search_filter)
+        # PERFORMANCE: Zuletzt angewendeter Suchtext (für inkrementelles Filtern)
+        self._last_search = ""
 
         # FIXED: Flag um Validierung während Initialisierung zu verhindern
         self._initialization_complete = False
 
-        # NEW: Rekursions-Schutz für Font-Size-Validierung
-        self._validating_font_size = False
+        # PERFORMANCE: Verschachtelungstiefe für _block_signals() (Tree-Signale beim Styling sperren)
+        self._signal_block_depth = 0
+        # PERFORMANCE: Verschachtelungstiefe für _block_item_changed() (itemChanged getrennt)
+        self._item_changed_blocked = 0
+        self._tree_signals_were_blocked = False
+
+        # PERFORMANCE: Anzahl angehakter Zeichen (statt Tree-Durchlauf in _has_any_checked_zeichen)
+        self._checked_zeichen_count = 0
+        # PERFORMANCE: Angehakte Zeichen (id -> Item, QTreeWidgetItem ist nicht hashbar),
+        # inkrementell gepflegt statt Tree-Durchlauf in _get_all_checked_zeichen
+        self._checked_zeichen: Dict[int, ZeichenTreeItem] = {}
+
+        # PERFORMANCE: Cache für Textlängen-Validierung
+        # Key: (modus, text) + _current_validation_inputs() + (item_name,)
+        self._validate_cache: Dict[tuple, tuple[bool, Optional[str]]] = {}
+        self._last_validation_inputs: Optional[tuple] = None
+
+        # PERFORMANCE: Kategorie-Items nach Pfad-Tupel (wird beim Tree-Aufbau befüllt)
+        self._category_item_by_path: Dict[tuple[str, ...], ZeichenTreeItem] = {}
+
+        # PERFORMANCE: Ein gemeinsames Modell für alle Modus-ComboBoxen (statt addItems pro Item)
+        self._modus_labels = tuple(get_modus_gui_labels())
+        self._shared_modus_model = QStandardItemModel(self)
+        for label in self._modus_labels:
+            self._shared_modus_model.appendRow(QStandardItem(label))
+        # Interner Modus -> ComboBox-Index (statt findText)
+        self._internal_to_index: Dict[str, int] = {
+            gui_to_internal(label): index for index, label in enumerate(self._modus_labels)
+        }
+
+        # PERFORMANCE: Vorberechnete Anzeige-/Dateiname-Texte pro SVG-Pfad (nach jedem Scan neu)
+        self._display_cache: Dict[Path, tuple[str, str]] = {}
+
+        # PERFORMANCE: Export-/Einstellungen-Dialog einmal erstellen, danach per reset() wiederverwenden
+        self._export_dialog = None
+        self._settings_dialog: Optional[SettingsDialog] = None
+
+        # PERFORMANCE: S1-Info-Labels gebündelt aktualisieren (_schedule_s1_update)
+        self._s1_update_pending = False
+
+        # PERFORMANCE: Letzte Eingaben der S1-Metriken/Info-Labels (Methodenname -> Key),
+        # unveränderte Eingaben überspringen die Neuberechnung
+        self._s1_metrics_cache: Dict[str, tuple] = {}
+
+        # PERFORMANCE: Font-Metrics pro Schriftart (Familie -> (Ascent, Descent) als Anteil der
+        # Schriftgröße), siehe _font_ascent_descent_ratio
+        self._fm_cache: Dict[str, tuple[float, float]] = {}
+
+        # Logische DPI für changeEvent (Font-Metrics-Cache bei Bildschirmwechsel verwerfen)
+        self._last_logical_dpi: int = self.logicalDpiX()
 
-        # NEW: EventFilter für NoScroll
-        self.no_scroll_filter = NoScrollWheelFilter()
+        # PERFORMANCE: Zuletzt gesetzter Text pro Info-Label (id(label) -> Text), siehe _set_label_text
+        self._label_texts: Dict[int, str] = {}
+
+        # PERFORMANCE: Widget -> Item Zuordnung für gemeinsame Slots (statt Lambda pro Widget)
+        self._widget_to_item: Dict[int, ZeichenTreeItem] = {}
+
+        # PERFORMANCE: Flache Item-Listen (Tree-Reihenfolge) für lineare Scans statt Rekursion
+        self._all_zeichen_items: list[ZeichenTreeItem] = []
+        self._all_category_items: list[ZeichenTreeItem] = []
 
         self.logger.info("Initialisiere Hauptfenster (tabellarisch)...")
 
@@ -190,6 +319,13 @@ class MainWindow(QMainWindow):
         UILoader().load_ui("main_window.ui", self)
         self.setWindowTitle(f"{PROGRAM_NAME} v{PROGRAM_VERSION}")
 
+        # PERFORMANCE: Optionale S1-Info-Labels einmal prüfen (statt hasattr pro SpinBox-Änderung)
+        self._has_s1_links_breite_label = hasattr(self, 'label_s1_links_breite_mm')
+        self._has_s1_grafik_labels = (
+            hasattr(self, 'label_s1_max_grafik_text_modi')
+            and hasattr(self, 'label_s1_max_grafik_nur_grafik')
+        )
+
         # Window-Icon setzen
         if ICON_PATH.exists():
             self.setWindowIcon(QIcon(str(ICON_PATH)))
@@ -234,11 +370,13 @@ class MainWindow(QMainWindow):
         self.logger.info("Hauptfenster initialisiert")
 
         # Font-Check durchführen
-        self._check_font_availability()
+        # PERFORMANCE: Erst nach dem ersten Event-Loop-Durchlauf (Font-Enumeration ist teuer,
+        # Fenster soll vorher sichtbar sein). Ergebnis wird pro Schriftart gecacht.
+        self._font_check_cache: Dict[str, tuple[str, bool]] = {}
+        QTimer.singleShot(0, self._check_font_availability)
 
         # OPTIMIZED: Kategorien NACH Fenster-Anzeige laden (bessere UX)
         # Verzögerter Start mit QTimer, damit Fenster zuerst sichtbar wird
-        from PyQt6.QtCore import QTimer
         QTimer.singleShot(100, self._on_neu_laden_delayed)
 
     def _init_ui(self):
@@ -267,9 +405,38 @@ class MainWindow(QMainWindow):
         self.tree_zeichen.setColumnHidden(ZeichenTreeItem.COL_GRAFIK_HOEHE, True)
         self.tree_zeichen.setColumnHidden(ZeichenTreeItem.COL_GRAFIK_BREITE, True)
 
+        # PERFORMANCE: Fortschrittsbalken für Tree-Aufbau (einmalig in Statusleiste,
+        # nur während des Ladens sichtbar)
+        self.progress_loading = QProgressBar()
+        self.progress_loading.setRange(0, 100)
+        self.progress_loading.setMaximumWidth(GUI_PROGRESS_BAR_MAX_WIDTH)
+        self.progress_loading.hide()
+        self.statusbar.addPermanentWidget(self.progress_loading)
+
+        # PERFORMANCE: Validierungs-Darstellung der Zeilen-Widgets einmal im Fenster-QSS
+        self._init_validation_stylesheet()
+
         # GUI-Elemente sind jetzt alle in .ui Datei definiert
         self.logger.debug("UI initialisiert")
 
+    def _init_validation_stylesheet(self):
+        """
+        Ergänzt das Fenster-Stylesheet um Regeln für die Validierungs-Hervorhebung
+
+        Die Zeilen-Widgets im Tree erhalten nur noch die dynamische Property
+        'validationState' ("error"/"ok", siehe _set_validation_state) statt
+        eines eigenen Stylesheets - das QSS wird so nur einmal geparst.
+        """
+        error = '[validationState="error"]'
+        self.setStyleSheet(self.styleSheet() + (
+            f"QLineEdit{error} {{ background-color: {VALIDATION_ERROR_BG}; "
+            f"color: {VALIDATION_ERROR_FG}; font-weight: bold; }}\n"
+            f"QSpinBox{error}, QSpinBox{error}::up-button, QSpinBox{error}::down-button "
+            f"{{ background-color: {VALIDATION_ERROR_BG}; }}\n"
+            f"QComboBox{error}, QComboBox{error}::drop-down "
+            f"{{ background-color: {VALIDATION_ERROR_BG}; }}\n"
+        ))
+
     def _add_logo_widget(self):
         """Laedt Logo in das label_logo Widget (definiert in .ui-Datei)"""
         if not LOGO_PATH.exists():
@@ -354,9 +521,9 @@ class MainWindow(QMainWindow):
         # NEW: S1-Layout Controls
         self.check_s1_aspect_locked.stateChanged.connect(self._on_s1_aspect_locked_changed)
         self.check_s1_aspect_locked.stateChanged.connect(self._on_settings_changed)
-        self.spin_s1_links_prozent.valueChanged.connect(self._on_s1_links_prozent_changed)
+        self.spin_s1_links_prozent.valueChanged.connect(self._schedule_s1_update)  # PERFORMANCE: gebündelt
         self.spin_s1_links_prozent.valueChanged.connect(self._on_settings_changed)
-        self.spin_s1_anzahl_schreiblinien.valueChanged.connect(self._on_s1_anzahl_schreiblinien_changed)
+        self.spin_s1_anzahl_schreiblinien.valueChanged.connect(self._schedule_s1_update)  # PERFORMANCE: gebündelt
         self.spin_s1_anzahl_schreiblinien.valueChanged.connect(self._on_settings_changed)
         self.check_s1_staerke_anzeigen.stateChanged.connect(self._on_settings_changed)
 
@@ -378,6 +545,7 @@ class MainWindow(QMainWindow):
         # S1-Zeichen-Parameter (synchronisiert mit S2)
         self.spin_s1_font_size.valueChanged.connect(self._sync_s1_to_s2_font_size)
         self.spin_s1_font_size.valueChanged.connect(self._on_settings_changed)
+        self.spin_s1_font_size.valueChanged.connect(self._schedule_s1_update)  # FIXED: Max-Grafik-Labels hängen von der Schriftgröße ab
         self.btn_s1_apply_recommended_font_size.clicked.connect(self._on_apply_recommended_font_size)
         self.check_s1_auto_font_size.stateChanged.connect(self._on_settings_changed)
         # REMOVED v0.8.2.2: Auto-Font-Size Sync entfernt - S1 und S2 sind jetzt unabhängig
@@ -387,8 +555,17 @@ class MainWindow(QMainWindow):
 
         self.spin_s1_abstand_grafik_text.valueChanged.connect(self._sync_s1_to_s2_abstand)
         self.spin_s1_abstand_grafik_text.valueChanged.connect(self._on_settings_changed)
+        self.spin_s1_abstand_grafik_text.valueChanged.connect(self._schedule_s1_update)  # FIXED: Max-Grafik-Labels
         self.spin_s1_text_bottom_offset.valueChanged.connect(self._sync_s1_to_s2_abstand)
         self.spin_s1_text_bottom_offset.valueChanged.connect(self._on_settings_changed)
+        self.spin_s1_text_bottom_offset.valueChanged.connect(self._schedule_s1_update)  # FIXED: Max-Grafik-Labels
+
+        # PERFORMANCE: Getippte Werte erst bei Enter/Fokusverlust übernehmen (editingFinished)
+        # statt bei jedem Tastendruck (Settings speichern + S1-Neuberechnung pro Ziffer).
+        # Pfeiltasten und Scrollrad bleiben live (valueChanged -> _schedule_s1_update)
+        for spin in (self.spin_s1_links_prozent, self.spin_s1_anzahl_schreiblinien, self.spin_s1_font_size,
+                     self.spin_s1_abstand_grafik_text, self.spin_s1_text_bottom_offset):
+            spin.setKeyboardTracking(False)
 
         # Menu-Actions
         self.action_vorlagen_ordner_oeffnen.triggered.connect(self._on_vorlagen_ordner_oeffnen)  # CHANGED
@@ -402,6 +579,7 @@ class MainWindow(QMainWindow):
 
         # Tree-Widget
         self.tree_zeichen.itemChanged.connect(self._on_item_changed)
+        self.tree_zeichen.itemExpanded.connect(self._on_item_expanded)  # PERFORMANCE: Lazy Widgets
 
         # Suchfeld
         self.line_search.textChanged.connect(self._on_search_text_changed)
@@ -550,10 +728,8 @@ class MainWindow(QMainWindow):
         # CRITICAL: Aspect-Lock initial anwenden (falls aktiviert)
         self._on_s1_aspect_locked_changed()
 
-        # S1: Auto-Berechnungen initial durchführen
-        self._update_s1_rechts_prozent()
-        self._update_s1_line_metrics()
-        self._update_s1_max_grafik_labels()  # NEW: Max. Grafikgrößen initial berechnen
+        # S1: Auto-Berechnungen initial durchführen (inkl. Max. Grafikgrößen)
+        self._flush_s1_update()
 
         # CHANGED v0.8.2.3: S1-Font-Size jetzt UNABHÄNGIG von S2
         # S1 nutzt settings.s1.font_size, S2 nutzt settings.zeichen.font_size
@@ -631,7 +807,7 @@ class MainWindow(QMainWindow):
 
         Performance-Optimierung: Nicht bei jedem Spin-Change, nur bei Bedarf!
         """
-        config = get_config()
+        config = self._runtime_cfg
 
         # S2-Layout (fuer normales S2-Layout verwendet)
         config.zeichen_hoehe_mm = self.spin_s2_zeichen_hoehe.value()
@@ -920,6 +1096,43 @@ class MainWindow(QMainWindow):
             self._center_window()
             self._window_centered = True
 
+            # Bildschirmwechsel (andere DPI) -> Font-Metrics prüfen (windowHandle existiert erst jetzt)
+            window_handle = self.windowHandle()
+            if window_handle is not None:
+                window_handle.screenChanged.connect(self._check_logical_dpi)
+
+    def changeEvent(self, event):
+        """
+        Event-Handler für Zustandsänderungen des Fensters
+
+        Bei Font-Änderungen (u.a. nach geänderter Skalierung) wird die logische DPI geprüft.
+
+        Args:
+            event: QEvent
+        """
+        super().changeEvent(event)
+
+        if event.type() == QEvent.Type.FontChange:
+            self._check_logical_dpi()
+
+    def _check_logical_dpi(self, *_args):
+        """
+        Verwirft die gecachten Font-Metrics und S1-Metriken, wenn sich die logische
+        DPI geändert hat (Fenster auf anderen Bildschirm verschoben, Skalierung geändert)
+
+        Args:
+            *_args: Ignoriert (neuer Screen bei screenChanged)
+        """
+        logical_dpi = self.logicalDpiX()
+        if logical_dpi == self._last_logical_dpi:
+            return
+
+        self._last_logical_dpi = logical_dpi
+        self._fm_cache.clear()
+        self._s1_metrics_cache.clear()
+        self.logger.debug("Logische DPI geändert (%d) - S1-Metriken werden neu berechnet", logical_dpi)
+        self._flush_s1_update()
+
     def _center_window(self):
         """
         Zentriert das Fenster auf dem Bildschirm (v0.8.3)
@@ -1003,7 +1216,7 @@ class MainWindow(QMainWindow):
             self.settings.grafik.max_breite_mm = breite_value
 
         # In RuntimeConfig speichern
-        config = get_config()
+        config = self._runtime_cfg
         config.grafik_hoehe_mm = hoehe_value
         config.grafik_breite_mm = breite_value
 
@@ -1025,7 +1238,7 @@ class MainWindow(QMainWindow):
             self.settings.grafik.position = position
 
         # In RuntimeConfig speichern
-        config = get_config()
+        config = self._runtime_cfg
         config.grafik_position = position
 
         self.logger.debug(f"Grafik-Position geändert: {position}")
@@ -1231,14 +1444,9 @@ class MainWindow(QMainWindow):
 
         # REMOVED: label_s1_max_grafikgroesse entfernt (groupBox_s1_grafik geloescht)
 
-        # NEW: Labels für maximale Grafikabmessungen aktualisieren
-        self._update_s1_max_grafik_labels()
-
-        # CHANGED: Auch Breiten-Anzeige aktualisieren (mm-Werte)
-        self._update_s1_rechts_prozent()
-
-        # NEW: Schreiblinien-Metriken aktualisieren (Zeilenhöhe/Schriftgröße neu berechnen)
-        self._update_s1_line_metrics()
+        # NEW: Max. Grafikabmessungen, Breiten-Anzeige (mm-Werte) und Schreiblinien-Metriken
+        # aktualisieren (PERFORMANCE: gebündelt, einmal pro Event-Loop-Durchlauf)
+        self._schedule_s1_update()
 
         # NEW v0.8.2.2: Auto-Adjust Schriftgroesse für S1 (nur wenn Checkbox aktiv)
         if self.check_s1_auto_font_size.isChecked():
@@ -1311,7 +1519,7 @@ class MainWindow(QMainWindow):
             self._sync_runtime_config_from_gui()
 
             # 2. RuntimeConfig zurück in AppSettings schreiben
-            config = get_config()
+            config = self._runtime_cfg
             config.save_to_settings(self.settings)
 
             # 3. Settings in Datei speichern
@@ -1360,14 +1568,41 @@ class MainWindow(QMainWindow):
 
         invalid_items = []
         affected_categories = set()  # NEW: Kategorien mit ungültigen Zeichen
+        text_modes = self.TEXT_MODES
 
-        # Alle Items durchgehen
-        for i in range(self.tree_zeichen.topLevelItemCount()):
-            top_item = self.tree_zeichen.topLevelItem(i)
-            if isinstance(top_item, ZeichenTreeItem):
-                invalid, categories = self._validate_text_lengths_recursive(top_item, top_item.name)
-                invalid_items.extend(invalid)
-                affected_categories.update(categories)
+        # PERFORMANCE: Flache Liste statt rekursivem Tree-Durchlauf
+        # FIXED: Nur GECHECKTE Zeichen validieren (nicht alle wie vorher)
+        candidates = [
+            item for item in self._all_zeichen_items
+            if item.checkState(0) == Qt.CheckState.Checked and
+            item.params.modus in text_modes and
+            item.params.text
+        ]
+
+        # PERFORMANCE: Noch nicht gecachte Texte in einem Batch validieren
+        self._prefetch_text_validation(candidates)
+
+        for item in candidates:
+            # Validiere Text (PERFORMANCE: gecacht)
+            is_valid, _ = self._validate_text_cached(item.params.text, item.params.modus, item.name)
+
+            if not is_valid:
+                # FIXED: GANZE ZEILE rot hinterlegen (nicht nur Text-Widget)
+                self._highlight_row(item, error=True)
+
+                # FIXED: Text-Widget mit Farb-Konstanten stylen (statt Magic Values)
+                if 'text' in item.widgets:
+                    self._set_text_error_style(item, True)
+
+                invalid_items.append(item.name)
+                # FIXED: Nur Parent-Kategorie hinzufügen (ohne Zeichen-Name)
+                if item._category_path:
+                    affected_categories.add(item._category_path)
+            else:
+                # FIXED: Normale Farbe zurücksetzen (Zeile + Text)
+                self._highlight_row(item, error=False)
+                if 'text' in item.widgets:
+                    self._set_text_error_style(item, False)
 
         # Sammel-Warnung ausgeben wenn ungültige Texte gefunden
         if invalid_items:
@@ -1398,10 +1633,6 @@ class MainWindow(QMainWindow):
         if not self._initialization_complete:
             return
 
-        # Rekursions-Schutz: Verhindert Endlosschleife wenn wir die Spinbox setzen
-        if hasattr(self, '_validating_font_size') and self._validating_font_size:
-            return
-
         # Aktuelle Werte aus GUI
         # CHANGED: S2-Widgets verwenden
         font_size = self.spin_font_size.value()
@@ -1426,17 +1657,19 @@ class MainWindow(QMainWindow):
             # Schriftgröße auf empfohlenen Wert setzen
             recommended = self._calculate_recommended_font_size()
 
-            # Rekursions-Schutz aktivieren
-            self._validating_font_size = True
-            try:
+            # CHANGED: QSignalBlocker statt Rekursions-Flag - valueChanged wird
+            # unterdrückt, daher kein erneuter Aufruf über _on_settings_changed
+            with QSignalBlocker(self.spin_font_size):
                 self.spin_font_size.setValue(recommended)
-                self.logger.warning(
-                    f"Schriftgröße {font_size}pt ungültig, "
-                    f"auf Empfehlung {recommended}pt gesetzt"
-                )
-            finally:
-                # Rekursions-Schutz deaktivieren
-                self._validating_font_size = False
+
+            # Signal wurde unterdrückt: Settings + Textlängen selbst nachziehen
+            self._save_ui_to_settings()
+            self._validate_all_text_lengths()
+
+            self.logger.warning(
+                f"Schriftgröße {font_size}pt ungültig, "
+                f"auf Empfehlung {recommended}pt gesetzt"
+            )
         else:
             self.logger.debug(f"Schriftgröße {font_size}pt ist gültig")
 
@@ -1447,131 +1680,275 @@ class MainWindow(QMainWindow):
         Returns:
             bool: True wenn mindestens ein Zeichen gecheckt ist
         """
-        for i in range(self.tree_zeichen.topLevelItemCount()):
-            top_item = self.tree_zeichen.topLevelItem(i)
-            if isinstance(top_item, ZeichenTreeItem):
-                if self._has_checked_zeichen_recursive(top_item):
-                    return True
-        return False
+        return self._checked_zeichen_count > 0
 
-    def _has_checked_zeichen_recursive(self, item: ZeichenTreeItem) -> bool:
+    def _update_checked_counts(self, item: ZeichenTreeItem, checked: bool):
         """
-        Prüft rekursiv ob mindestens ein Zeichen gecheckt ist
+        Aktualisiert Checked-Zähler für ein Zeichen und alle seine Kategorien
+
+        Pflegt den globalen _checked_zeichen_count, die Menge _checked_zeichen
+        und _checked_descendant_count der Vorfahren (Tiefe ~3). Mehrfachaufrufe mit gleichem Status sind
+        wirkungslos, daher auch aus _on_item_changed (feuert bei jeder
+        Datenänderung) sicher aufrufbar.
 
         Args:
-            item: Tree-Item
+            item: Zeichen-Item
+            checked: Neuer Checkbox-Status
+        """
+        if item._counted_as_checked == checked:
+            return
+        item._counted_as_checked = checked
+
+        if checked:
+            delta = 1
+            self._checked_zeichen[id(item)] = item
+        else:
+            delta = -1
+            self._checked_zeichen.pop(id(item), None)
+        self._checked_zeichen_count += delta
+
+        parent = item.parent()
+        while isinstance(parent, ZeichenTreeItem):
+            parent._checked_descendant_count += delta
+            parent = parent.parent()
+
+    def _current_validation_inputs(self) -> tuple:
+        """
+        Liefert alle Eingaben der Textvalidierung
+
+        Leert den Validierungs-Cache, sobald sich eine Eingabe geändert hat.
+        FIXED: Enthält auch die Werte, die validate_text_lengths_batch() bzw.
+        ZeichenConfig.__post_init__ direkt aus der RuntimeConfig lesen (Offsets,
+        Schriftart, Export-DPI, Zeichenabmessungen) - diese ändern sich über
+        _on_einstellungen() und _sync_runtime_config_from_gui().
 
         Returns:
-            bool: True wenn mindestens ein gecheckte Zeichen gefunden
+            tuple: (font_size, zeichen_hoehe_mm, zeichen_breite_mm, sicherheitsabstand_mm,
+                    text_bottom_offset_mm, abstand_grafik_text_mm, font_family, export_dpi,
+                    runtime_zeichen_hoehe_mm, runtime_zeichen_breite_mm)
+        """
+        zeichen = self.settings.zeichen
+        runtime_cfg = self._runtime_cfg
+        inputs = (
+            runtime_cfg.font_size,
+            zeichen.zeichen_hoehe_mm,
+            zeichen.zeichen_breite_mm,
+            zeichen.sicherheitsabstand_mm,
+            runtime_cfg.text_bottom_offset_mm,
+            runtime_cfg.abstand_grafik_text_mm,
+            runtime_cfg.font_family,
+            runtime_cfg.export_dpi,
+            runtime_cfg.zeichen_hoehe_mm,
+            runtime_cfg.zeichen_breite_mm
+        )
+        if inputs != self._last_validation_inputs:
+            self._validate_cache.clear()
+            self._last_validation_inputs = inputs
+        return inputs
+
+    def _prefetch_text_validation(self, items: list[ZeichenTreeItem]):
         """
-        # Wenn Zeichen: Prüfe Checkbox-Status
-        if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
-            return item.checkState(0) == Qt.CheckState.Checked
+        Füllt den Validierungs-Cache für mehrere Zeichen mit EINEM Batch-Aufruf
 
-        # Für Kategorien: Rekursiv Kinder prüfen
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if isinstance(child, ZeichenTreeItem):
-                if self._has_checked_zeichen_recursive(child):
-                    return True
+        PERFORMANCE: validate_text_lengths_batch() ermittelt Geometrie/Overlay einmal
+        und misst gleiche Texte nur einmal. Danach liefert _validate_text_cached()
+        für diese Zeichen nur noch Cache-Treffer.
 
-        return False
+        Args:
+            items: Zeichen mit Text-Modus und Text
+        """
+        inputs = self._current_validation_inputs()
+        cache = self._validate_cache
 
-    def _validate_text_lengths_recursive(
-        self,
-        item: ZeichenTreeItem,
-        category_path: str = ""
-    ) -> tuple[list[str], set[str]]:
+        missing_keys = []
+        entries = []
+        for item in items:
+            params = item.params
+            key = (params.modus, params.text) + inputs + (item.name,)
+            if key in cache:
+                continue
+            cache[key] = None  # Platzhalter: doppelte Einträge nur einmal validieren
+            missing_keys.append(key)
+            entries.append((params.text, params.modus, item.name))
+
+        if not entries:
+            return
+
+        font_size, zeichen_hoehe_mm, zeichen_breite_mm, sicherheitsabstand_mm = inputs[:4]
+        results = self.validation_mgr.validate_text_lengths_batch(
+            entries,
+            zeichen_hoehe_mm=zeichen_hoehe_mm,
+            zeichen_breite_mm=zeichen_breite_mm,
+            sicherheitsabstand_mm=sicherheitsabstand_mm,
+            font_size=font_size
+        )
+        for key, result in zip(missing_keys, results):
+            cache[key] = result
+
+    def _validate_text_cached(self, text: str, modus: str, item_name: str) -> tuple[bool, Optional[str]]:
         """
-        Validiert Textlängen rekursiv (nur GECHECKTE Zeichen)
+        Validiert Textlänge mit Cache (Wrapper um validate_text_length)
 
-        Diese Methode durchläuft den Tree rekursiv und prüft für jedes
-        AKTIVE (gecheckte) Zeichen, ob der Text in den sicheren Bereich passt.
-        Fehlerhafte Zeilen werden rot markiert, betroffene Kategorien werden
-        zur Rückgabe-Liste hinzugefügt.
+        Der Cache wird geleert sobald sich eine Eingabe aus
+        _current_validation_inputs() ändert: Zeichengröße, Sicherheitsabstand,
+        Schriftgröße/-art, Text-Offsets oder Export-DPI (z.B. nach
+        _on_einstellungen() oder _sync_runtime_config_from_gui()).
+        item_name ist Teil des Keys, da er in der Fehlermeldung erscheint.
 
         Args:
-            item: Tree-Item (Kategorie, Unterkategorie oder Zeichen)
-            category_path: Pfad der PARENT-Kategorie (ohne aktuelles Item).
-                          Beispiel: "Gefahren" oder "Gefahren > Akute"
-                          NICHT erweitert mit Zeichen-Namen!
+            text: Zu prüfender Text
+            modus: Interner Modus (z.B. "freitext")
+            item_name: Name des Items für Fehlermeldung
 
         Returns:
-            tuple:
-                - list[str]: Namen von Items mit zu langen Texten
-                - set[str]: Betroffene Kategorie-Pfade (für Hervorhebung)
+            tuple[bool, Optional[str]]: (is_valid, error_msg) wie validate_text_length
+        """
+        inputs = self._current_validation_inputs()
 
-        Example:
-            invalid, categories = self._validate_text_lengths_recursive(
-                top_item, "Gefahren"
+        key = (modus, text) + inputs + (item_name,)
+        result = self._validate_cache.get(key)
+        if result is None:
+            font_size, zeichen_hoehe_mm, zeichen_breite_mm, sicherheitsabstand_mm = inputs[:4]
+            result = self.validation_mgr.validate_text_length(
+                text=text,
+                modus=modus,
+                zeichen_hoehe_mm=zeichen_hoehe_mm,
+                zeichen_breite_mm=zeichen_breite_mm,
+                sicherheitsabstand_mm=sicherheitsabstand_mm,
+                font_size=font_size,
+                item_name=item_name
             )
+            self._validate_cache[key] = result
+        return result
+
+    @contextmanager
+    def _block_signals(self) -> Iterator[None]:
         """
-        invalid_items = []
-        affected_categories = set()
+        Sperrt Tree-Signale während Styling-Durchläufen (verschachtelbar)
 
-        # FIXED: Nur GECHECKTE Zeichen validieren (nicht alle wie vorher)
-        if (item.item_type == ZeichenTreeItem.TYPE_ZEICHEN and
-            item.checkState(0) == Qt.CheckState.Checked and  # FIXED: Checkbox-Prüfung hinzugefügt
-            item.params.modus in self.TEXT_MODES and
-            item.params.text and
-            item.widgets):
-
-            # FIXED: font_size aus RuntimeConfig verwenden
-            from runtime_config import get_config
-            runtime_cfg = get_config()
-
-            # Validiere Text
-            is_valid, error_msg = self.validation_mgr.validate_text_length(
-                text=item.params.text,
-                modus=item.params.modus,
-                zeichen_hoehe_mm=self.settings.zeichen.zeichen_hoehe_mm,
-                zeichen_breite_mm=self.settings.zeichen.zeichen_breite_mm,
-                sicherheitsabstand_mm=self.settings.zeichen.sicherheitsabstand_mm,
-                font_size=runtime_cfg.font_size,  # FIXED: Aus RuntimeConfig statt DEFAULT_FONT_SIZE
-                item_name=item.name
-            )
+        setBackground()/setForeground()/setFont() lösen itemChanged aus, was
+        wiederum _on_item_changed und damit weitere Validierungen anstößt.
+        Der Zähler sorgt dafür, dass nur der äußerste Block die Signale wieder
+        freigibt - und zwar in den Zustand von vor dem ersten Block.
 
-            if not is_valid:
-                # FIXED: GANZE ZEILE rot hinterlegen (nicht nur Text-Widget)
+        Example:
+            with self._block_signals():
                 self._highlight_row(item, error=True)
+        """
+        if self._signal_block_depth == 0:
+            self._tree_signals_were_blocked = self.tree_zeichen.blockSignals(True)
+        self._signal_block_depth += 1
+        try:
+            yield
+        finally:
+            self._signal_block_depth -= 1
+            if self._signal_block_depth == 0:
+                self.tree_zeichen.blockSignals(self._tree_signals_were_blocked)
 
-                # FIXED: Text-Widget mit Farb-Konstanten stylen (statt Magic Values)
-                if 'text' in item.widgets:
-                    item.widgets['text'].setStyleSheet(
-                        f"background-color: {VALIDATION_ERROR_BG}; "
-                        f"color: {VALIDATION_ERROR_FG}; "
-                        f"font-weight: bold;"
-                    )
+    @contextmanager
+    def _block_item_changed(self) -> Iterator[None]:
+        """
+        Trennt itemChanged von _on_item_changed (verschachtelbar, referenzgezählt)
 
-                # Zur Warnliste hinzufügen (sind bereits alle gecheckt durch obige Prüfung)
-                invalid_items.append(item.name)
-                # FIXED: Nur Parent-Kategorie hinzufügen (ohne Zeichen-Name)
-                if category_path:
-                    affected_categories.add(category_path)
-            else:
-                # FIXED: Normale Farbe zurücksetzen (Zeile + Text)
-                self._highlight_row(item, error=False)
-                if 'text' in item.widgets:
-                    item.widgets['text'].setStyleSheet("")
+        Im Gegensatz zu _block_signals() bleiben andere Tree-Signale aktiv
+        (blockSignals() auf dem TreeWidget löscht die Selection). Nur der
+        äußerste Block trennt/verbindet, verschachtelte Batch-Aufrufe kosten nichts.
 
-        # Rekursiv für Kinder
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if isinstance(child, ZeichenTreeItem):
-                # FIXED: Pfad nur für Kategorien erweitern, NICHT für Zeichen
-                # Grund: category_path soll nur Kategorie-Namen enthalten, nicht Zeichen
-                if child.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
-                    # Für Zeichen: Aktuellen Kategorie-Pfad beibehalten (nicht erweitern)
-                    child_path = category_path
-                else:
-                    # Für Kategorien/Unterkategorien: Pfad erweitern
-                    child_path = f"{category_path} > {child.name}" if category_path else child.name
+        Example:
+            with self._block_item_changed():
+                self._set_children_checked(item, checked)
+        """
+        if self._item_changed_blocked == 0:
+            self.tree_zeichen.itemChanged.disconnect(self._on_item_changed)
+        self._item_changed_blocked += 1
+        try:
+            yield
+        finally:
+            self._item_changed_blocked -= 1
+            if self._item_changed_blocked == 0:
+                self.tree_zeichen.itemChanged.connect(self._on_item_changed)
+
+    @contextmanager
+    def _bulk_tree_update(self) -> Iterator[None]:
+        """
+        Massenänderungen am Tree ohne Zwischen-Repaints und dataChanged-Flut
+
+        Deaktiviert Tree-Updates und blockiert die Model-Signale (pro Zeile ein
+        dataChanged), danach einmaliges Neuzeichnen. Verschachtelbar: der
+        vorherige Zustand wird wiederhergestellt, nur der äußerste Block zeichnet.
+
+        Example:
+            with self._bulk_tree_update():
+                self._set_children_checked(item, checked)
+        """
+        tree = self.tree_zeichen
+        model = tree.model()
+        updates_were_enabled = tree.updatesEnabled()
+        tree.setUpdatesEnabled(False)
+        model_was_blocked = model.blockSignals(True)
+        try:
+            yield
+        finally:
+            model.blockSignals(model_was_blocked)
+            if updates_were_enabled:
+                tree.setUpdatesEnabled(True)
+                tree.viewport().update()
+
+    @contextmanager
+    def _tree_updates_paused(self) -> Iterator[None]:
+        """
+        Pausiert den Tree für eine komplette Kaskade (Propagierung, Haken, Suche)
+
+        Kombiniert _block_item_changed() (itemChanged getrennt) und
+        _bulk_tree_update() (keine Repaints/dataChanged) und stellt die
+        Selection danach wieder her. Beide Teile sind verschachtelbar.
+
+        Example:
+            with self._tree_updates_paused():
+                self._set_children_checked(item, checked)
+        """
+        selected = self.tree_zeichen.selectedItems()
+        try:
+            with self._block_item_changed(), self._bulk_tree_update():
+                yield
+        finally:
+            for selected_item in selected:
+                if not selected_item.isSelected():
+                    selected_item.setSelected(True)
+
+    def _set_text_error_style(self, item: ZeichenTreeItem, error: bool):
+        """
+        Setzt/entfernt die Fehler-Darstellung des Textfelds eines Items (rot, fett)
+
+        PERFORMANCE: Dynamische Property statt setStyleSheet() (Fenster-QSS wird nur
+        einmal geparst), unveränderter Zustand wird übersprungen (item._last_text_style_state).
 
-                invalid, categories = self._validate_text_lengths_recursive(child, child_path)
-                invalid_items.extend(invalid)
-                affected_categories.update(categories)
+        Args:
+            item: Tree-Item mit Text-Widget
+            error: True = Fehler-Darstellung, False = Normal
+        """
+        state = "error" if error else "ok"
+        line_text = item.widgets.get('text')
+        if line_text is None or item._last_text_style_state == state:
+            return
+        item._last_text_style_state = state
+        self._set_validation_state(line_text, state)
+
+    @staticmethod
+    def _set_validation_state(widget, state: str):
+        """
+        Setzt die dynamische Property 'validationState' und aktualisiert den Stil
+
+        Die zugehörigen Regeln stehen im Fenster-Stylesheet (_init_validation_stylesheet).
 
-        return invalid_items, affected_categories
+        Args:
+            widget: Zeilen-Widget (QLineEdit, QSpinBox, QComboBox)
+            state: "error" oder "ok"
+        """
+        widget.setProperty("validationState", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def _highlight_row(self, item: ZeichenTreeItem, error: bool):
         """
@@ -1592,62 +1969,58 @@ class MainWindow(QMainWindow):
             # Zeile zurücksetzen bei gültigem Text
             self._highlight_row(zeichen_item, error=False)
         """
-        # FIXED: Farb-Konstanten verwenden statt Magic Values
-        if error:
-            bg_color = VALIDATION_ERROR_BG  # Helles Rot für Fehler
-            bg_brush = QBrush(QColor(bg_color))
-        else:
-            bg_color = VALIDATION_NORMAL_BG  # Normaler Hintergrund (weiß)
-            bg_brush = QBrush(QColor(Qt.GlobalColor.white))
+        # PERFORMANCE: Unveränderten Zustand überspringen (nur Zeichen - Kategorie-Zeilen
+        # werden zusätzlich direkt von _highlight_categories() gestylt)
+        state = "error" if error else "ok"
+        if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
+            if error:
+                self._invalid_leaves[id(item)] = item
+            else:
+                self._invalid_leaves.pop(id(item), None)
+            if item._last_row_style_state == state:
+                return
+            item._last_row_style_state = state
 
-        # Spalten mit setBackground() färben (funktioniert für Spalten OHNE Widgets)
-        for col in range(self.tree_zeichen.columnCount()):
-            item.setBackground(col, bg_brush)
+        with self._block_signals():
+            # FIXED: Farb-Konstanten verwenden statt Magic Values
+            if error:
+                bg_brush = QBrush(QColor(VALIDATION_ERROR_BG))  # Helles Rot für Fehler
+            else:
+                bg_brush = QBrush(QColor(Qt.GlobalColor.white))  # Normaler Hintergrund (weiß)
 
-        # FIXED: Zeichenname (Spalte 0) auch rot + fett machen
-        if error:
-            item.setForeground(0, QBrush(QColor(VALIDATION_ERROR_FG)))  # Rot
-            # Fettschrift für Zeichenname
-            font = item.font(0)
-            font.setBold(True)
-            item.setFont(0, font)
-        else:
-            item.setForeground(0, QBrush(QColor(Qt.GlobalColor.black)))  # Normal schwarz
-            # Normale Schrift
-            font = item.font(0)
-            font.setBold(False)
-            item.setFont(0, font)
+            # Spalten mit setBackground() färben (funktioniert für Spalten OHNE Widgets)
+            for col in range(self.tree_zeichen.columnCount()):
+                item.setBackground(col, bg_brush)
 
-        # FIXED: Widgets direkt stylen (setBackground funktioniert nicht für Widget-Spalten)
-        # Alle Sub-Controls müssen explizit gestylt werden (up/down buttons, drop-down)
-        if item.widgets:
-            # FIXED: Kopien-SpinBox mit allen Sub-Controls stylen
-            if 'kopien' in item.widgets:
-                if error:
-                    item.widgets['kopien'].setStyleSheet(
-                        f"QSpinBox {{ background-color: {bg_color}; }} "
-                        f"QSpinBox::up-button {{ background-color: {bg_color}; }} "
-                        f"QSpinBox::down-button {{ background-color: {bg_color}; }}"
-                    )
-                else:
-                    item.widgets['kopien'].setStyleSheet("")  # Reset auf Default
-
-            # FIXED: Modus-ComboBox mit Drop-Down-Button stylen
-            if 'modus' in item.widgets:
-                if error:
-                    item.widgets['modus'].setStyleSheet(
-                        f"QComboBox {{ background-color: {bg_color}; }} "
-                        f"QComboBox::drop-down {{ background-color: {bg_color}; }}"
-                    )
-                else:
-                    item.widgets['modus'].setStyleSheet("")  # Reset auf Default
+            # FIXED: Zeichenname (Spalte 0) auch rot + fett machen
+            if error:
+                item.setForeground(0, QBrush(QColor(VALIDATION_ERROR_FG)))  # Rot
+                # Fettschrift für Zeichenname
+                font = item.font(0)
+                font.setBold(True)
+                item.setFont(0, font)
+            else:
+                item.setForeground(0, QBrush(QColor(Qt.GlobalColor.black)))  # Normal schwarz
+                # Normale Schrift
+                font = item.font(0)
+                font.setBold(False)
+                item.setFont(0, font)
+
+            # FIXED: Widgets direkt stylen (setBackground funktioniert nicht für Widget-Spalten)
+            # PERFORMANCE: Dynamische Property statt Stylesheet pro Widget - die Regeln
+            # (inkl. Sub-Controls up/down buttons, drop-down) stehen einmal im Fenster-QSS
+            if item.widgets:
+                if 'kopien' in item.widgets:
+                    self._set_validation_state(item.widgets['kopien'], state)
+                if 'modus' in item.widgets:
+                    self._set_validation_state(item.widgets['modus'], state)
 
-            # NOTE: Text-Widget behält seine eigene Farbe (rot/fett bei Fehler)
-            # Wird separat in Validierung gesetzt (_validate_text_lengths_recursive)
+                # NOTE: Text-Widget behält seine eigene Farbe (rot/fett bei Fehler)
+                # Wird separat in Validierung gesetzt (_validate_all_text_lengths)
 
-            # v7.1: Grafik-Widget-Styling entfernt (keine per-Item-Grafik-Widgets mehr)
+                # v7.1: Grafik-Widget-Styling entfernt (keine per-Item-Grafik-Widgets mehr)
 
-    def _highlight_categories(self, category_paths: set[str]):
+    def _highlight_categories(self, category_paths: set[tuple[str, ...]]):
         """
         Hebt Kategorien/Unterkategorien rot hervor (GANZE Zeile + Name)
 
@@ -1659,26 +2032,27 @@ class MainWindow(QMainWindow):
         Kategorien die NICHT betroffen sind, werden zurückgesetzt.
 
         Args:
-            category_paths: Set von Kategorie-Pfaden.
-                           Beispiel: {"Gefahren", "Gefahren > Akute"}
-                           Format: "TopLevel" oder "TopLevel > SubLevel"
+            category_paths: Set von Kategorie-Pfaden als Tupel.
+                           Beispiel: {("Gefahren",), ("Gefahren", "Akute")}
+                           Format: ("TopLevel",) oder ("TopLevel", "SubLevel")
 
         Example:
-            affected = {"Gefahren", "Fahrzeuge > Einsatzfahrzeuge"}
+            affected = {("Gefahren",), ("Fahrzeuge", "Einsatzfahrzeuge")}
             self._highlight_categories(affected)  # Färbt Zeilen + Namen rot
         """
-        # FIXED: Intelligentes Update statt komplettes Reset
-        # Gehe durch ALLE Kategorien und aktualisiere gezielt
-        for i in range(self.tree_zeichen.topLevelItemCount()):
-            top_item = self.tree_zeichen.topLevelItem(i)
-            if isinstance(top_item, ZeichenTreeItem):
-                self._update_category_highlight_recursive(top_item, "", category_paths)
+        with self._block_signals():
+            # FIXED: Intelligentes Update statt komplettes Reset
+            # Gehe durch ALLE Kategorien und aktualisiere gezielt
+            for i in range(self.tree_zeichen.topLevelItemCount()):
+                top_item = self.tree_zeichen.topLevelItem(i)
+                if isinstance(top_item, ZeichenTreeItem):
+                    self._update_category_highlight_recursive(top_item, (), category_paths)
 
     def _update_category_highlight_recursive(
         self,
         item: ZeichenTreeItem,
-        parent_path: str,
-        affected_paths: set[str]
+        parent_path: tuple[str, ...],
+        affected_paths: set[tuple[str, ...]]
     ):
         """
         Aktualisiert Kategorie-Hervorhebung rekursiv und intelligent
@@ -1691,55 +2065,84 @@ class MainWindow(QMainWindow):
 
         Args:
             item: Aktuelles Tree-Item
-            parent_path: Pfad des Parents (z.B. "Gefahren")
+            parent_path: Pfad des Parents (z.B. ("Gefahren",))
             affected_paths: Set der betroffenen Kategorie-Pfade
 
         Example:
-            affected = {"Gefahren", "Fahrzeuge > Einsatzfahrzeuge"}
-            self._update_category_highlight_recursive(top_item, "", affected)
+            affected = {("Gefahren",), ("Fahrzeuge", "Einsatzfahrzeuge")}
+            self._update_category_highlight_recursive(top_item, (), affected)
         """
-        # Nur Kategorien/Unterkategorien behandeln (keine Zeichen)
-        if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
-            return
+        with self._block_signals():
+            # Nur Kategorien/Unterkategorien behandeln (keine Zeichen)
+            if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
+                return
 
-        # Aktuellen Pfad bauen
-        current_path = f"{parent_path} > {item.name}" if parent_path else item.name
+            # Aktuellen Pfad bauen
+            current_path = parent_path + (item.name,)
 
-        # Prüfen ob diese Kategorie betroffen ist
-        if current_path in affected_paths:
-            # ROT färben
-            item.setForeground(0, QBrush(QColor(VALIDATION_ERROR_FG)))
-            font = item.font(0)
-            font.setBold(True)
-            item.setFont(0, font)
+            # Prüfen ob diese Kategorie betroffen ist (rot färben oder zurücksetzen)
+            self._set_category_highlight(item, current_path in affected_paths)
+
+            # Rekursiv für Kinder
+            for i in range(item.childCount()):
+                child = item.child(i)
+                if isinstance(child, ZeichenTreeItem):
+                    self._update_category_highlight_recursive(child, current_path, affected_paths)
+
+    def _set_category_highlight(self, item: ZeichenTreeItem, error: bool):
+        """
+        Färbt eine einzelne Kategorie-Zeile rot (Fehler) oder setzt sie zurück
 
-            # Ganze Zeile rot hinterlegen
+        Args:
+            item: Kategorie-Item
+            error: True = Rot + fett, False = Normal (schwarz auf weiß)
+        """
+        if error:
+            fg_brush = QBrush(QColor(VALIDATION_ERROR_FG))
             bg_brush = QBrush(QColor(VALIDATION_ERROR_BG))
-            for col in range(self.tree_zeichen.columnCount()):
-                item.setBackground(col, bg_brush)
         else:
-            # ZURÜCKSETZEN (normale Farbe)
-            item.setForeground(0, QBrush(QColor(Qt.GlobalColor.black)))
-            font = item.font(0)
-            font.setBold(False)
-            item.setFont(0, font)
+            fg_brush = QBrush(QColor(Qt.GlobalColor.black))
+            bg_brush = QBrush(QColor(Qt.GlobalColor.white))
 
-            # Ganze Zeile weiß hinterlegen
-            for col in range(self.tree_zeichen.columnCount()):
-                item.setBackground(col, QBrush(QColor(Qt.GlobalColor.white)))
+        # Name rot + fett bzw. normal
+        item.setForeground(0, fg_brush)
+        font = item.font(0)
+        font.setBold(error)
+        item.setFont(0, font)
 
-        # Rekursiv für Kinder
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if isinstance(child, ZeichenTreeItem):
-                self._update_category_highlight_recursive(child, current_path, affected_paths)
+        # Ganze Zeile hinterlegen
+        for col in range(self.tree_zeichen.columnCount()):
+            item.setBackground(col, bg_brush)
+
+    def _revalidate_ancestors(self, item: ZeichenTreeItem):
+        """
+        Aktualisiert die Hervorhebung der Vorfahren-Kategorien eines Zeichens
+
+        PERFORMANCE: Statt alle Texte neu zu validieren (_validate_all_text_lengths)
+        wird nur die Kette item.parent() nach oben geprüft. Ob eine Kategorie rot
+        bleibt, ergibt sich aus den bereits markierten Zeichen (_invalid_leaves).
+
+        Args:
+            item: Zeichen-Item, dessen Zustand sich geändert hat
+        """
+        invalid_paths = {leaf._category_path for leaf in self._invalid_leaves.values()}
+
+        with self._block_signals():
+            parent = item.parent()
+            while isinstance(parent, ZeichenTreeItem):
+                path = parent._category_path
+                depth = len(path)
+                has_invalid = any(p[:depth] == path for p in invalid_paths)
+                self._set_category_highlight(parent, has_invalid)
+                parent = parent.parent()
 
     def _reset_all_category_highlights(self):
         """Setzt Hervorhebung aller Kategorien/Unterkategorien zurück"""
-        for i in range(self.tree_zeichen.topLevelItemCount()):
-            top_item = self.tree_zeichen.topLevelItem(i)
-            if isinstance(top_item, ZeichenTreeItem):
-                self._reset_category_highlight_recursive(top_item)
+        with self._block_signals():
+            for i in range(self.tree_zeichen.topLevelItemCount()):
+                top_item = self.tree_zeichen.topLevelItem(i)
+                if isinstance(top_item, ZeichenTreeItem):
+                    self._reset_category_highlight_recursive(top_item)
 
     def _reset_category_highlight_recursive(self, item: ZeichenTreeItem):
         """Setzt Hervorhebung rekursiv zurück (Zeile + Name)"""
@@ -1761,81 +2164,39 @@ class MainWindow(QMainWindow):
             if isinstance(child, ZeichenTreeItem):
                 self._reset_category_highlight_recursive(child)
 
-    def _highlight_category_by_path(self, path: str):
+    def _highlight_category_by_path(self, parts: tuple[str, ...]):
         """
         Hebt Kategorie anhand Pfad rot hervor
 
-        Sucht die Kategorie anhand des Pfades und färbt sie rot.
-        Unterstützt verschachtelte Pfade (TopLevel > SubLevel).
+        Färbt alle Ebenen des Pfades rot (TopLevel, TopLevel > SubLevel, ...).
+        Die Items werden direkt aus _category_item_by_path geholt (keine Tree-Suche).
 
         Args:
-            path: Kategorie-Pfad mit ">" als Trenner.
-                 Beispiel: "Gefahren" oder "Gefahren > Akute"
+            parts: Kategorie-Pfad als Tupel.
+                  Beispiel: ("Gefahren",) oder ("Gefahren", "Akute")
 
         Example:
-            self._highlight_category_by_path("Gefahren > Akute")
+            self._highlight_category_by_path(("Gefahren", "Akute"))
         """
-        parts = [p.strip() for p in path.split(">")]
-        if not parts:
-            return
+        with self._block_signals():
+            fg_brush = QBrush(QColor(VALIDATION_ERROR_FG))
+            bg_brush = QBrush(QColor(VALIDATION_ERROR_BG))
+            column_count = self.tree_zeichen.columnCount()
+
+            for level in range(len(parts)):
+                category_item = self._category_item_by_path.get(parts[:level + 1])
+                if category_item is None:
+                    return
 
-        # Erste Ebene suchen (Top-Level Kategorie)
-        for i in range(self.tree_zeichen.topLevelItemCount()):
-            top_item = self.tree_zeichen.topLevelItem(i)
-            if isinstance(top_item, ZeichenTreeItem) and top_item.name == parts[0]:
                 # FIXED: Kategorie-Name rot + fett
-                top_item.setForeground(0, QBrush(QColor(VALIDATION_ERROR_FG)))
-                font = top_item.font(0)
+                category_item.setForeground(0, fg_brush)
+                font = category_item.font(0)
                 font.setBold(True)
-                top_item.setFont(0, font)
+                category_item.setFont(0, font)
 
                 # FIXED: Ganze Kategorie-Zeile rot hinterlegen
-                bg_brush = QBrush(QColor(VALIDATION_ERROR_BG))
-                for col in range(self.tree_zeichen.columnCount()):
-                    top_item.setBackground(col, bg_brush)
-
-                # Wenn Pfad länger, rekursiv in Kinder gehen
-                if len(parts) > 1:
-                    self._highlight_child_by_path(top_item, parts[1:])
-                break
-
-    def _highlight_child_by_path(self, parent: ZeichenTreeItem, parts: list[str]):
-        """
-        Rekursive Suche und Hervorhebung in Kindern
-
-        Helper-Methode für _highlight_category_by_path. Durchsucht
-        Kinder rekursiv und färbt gefundene Kategorien rot.
-
-        Args:
-            parent: Parent-Item in dem gesucht wird
-            parts: Restliche Pfad-Teile als Liste
-
-        Example:
-            self._highlight_child_by_path(top_item, ["Akute", "Explosiv"])
-        """
-        if not parts:
-            return
-
-        for i in range(parent.childCount()):
-            child = parent.child(i)
-            if isinstance(child, ZeichenTreeItem) and child.name == parts[0]:
-                # FIXED: Unterkategorie-Name rot + fett
-                child.setForeground(0, QBrush(QColor(VALIDATION_ERROR_FG)))
-                font = child.font(0)
-                font.setBold(True)
-                child.setFont(0, font)
-
-                # FIXED: Ganze Unterkategorie-Zeile rot hinterlegen
-                bg_brush = QBrush(QColor(VALIDATION_ERROR_BG))
-                tree_widget = child.treeWidget()
-                if tree_widget:
-                    for col in range(tree_widget.columnCount()):
-                        child.setBackground(col, bg_brush)
-
-                # Wenn noch mehr Teile, weiter rekursiv
-                if len(parts) > 1:
-                    self._highlight_child_by_path(child, parts[1:])
-                break
+                for col in range(column_count):
+                    category_item.setBackground(col, bg_brush)
 
     def _validate_single_zeichen(self, item: ZeichenTreeItem):
         """
@@ -1856,20 +2217,8 @@ class MainWindow(QMainWindow):
         if item.params.modus not in self.TEXT_MODES or not item.params.text:
             return
 
-        # FIXED: font_size aus RuntimeConfig verwenden
-        from runtime_config import get_config
-        runtime_cfg = get_config()
-
-        # Validierung durchführen
-        is_valid, error_msg = self.validation_mgr.validate_text_length(
-            text=item.params.text,
-            modus=item.params.modus,
-            zeichen_hoehe_mm=self.settings.zeichen.zeichen_hoehe_mm,
-            zeichen_breite_mm=self.settings.zeichen.zeichen_breite_mm,
-            sicherheitsabstand_mm=self.settings.zeichen.sicherheitsabstand_mm,
-            font_size=runtime_cfg.font_size,  # FIXED: Aus RuntimeConfig statt DEFAULT_FONT_SIZE
-            item_name=item.name
-        )
+        # Validierung durchführen (PERFORMANCE: gecacht)
+        is_valid, error_msg = self._validate_text_cached(item.params.text, item.params.modus, item.name)
 
         if not is_valid:
             self.logger.warning(f"Einzelzeichen-Validierung: '{item.name}' hat zu langen Text")
@@ -1877,11 +2226,7 @@ class MainWindow(QMainWindow):
             # Zeile rot hervorheben
             self._highlight_row(item, error=True)
             if 'text' in item.widgets:
-                item.widgets['text'].setStyleSheet(
-                    f"background-color: {VALIDATION_ERROR_BG}; "
-                    f"color: {VALIDATION_ERROR_FG}; "
-                    f"font-weight: bold;"
-                )
+                self._set_text_error_style(item, True)
 
             # FIXED: Kategorie-Pfad ermitteln und ALLE Ebenen hervorheben
             category_path = self._get_category_path_for_zeichen(item)
@@ -1905,7 +2250,7 @@ class MainWindow(QMainWindow):
             # Zeile zurücksetzen
             self._highlight_row(item, error=False)
             if 'text' in item.widgets:
-                item.widgets['text'].setStyleSheet("")
+                self._set_text_error_style(item, False)
 
             # FIXED: Kategorien-Hervorhebung neu berechnen OHNE Warnung
             # (Falls andere Zeichen in dieser Kategorie noch invalid sind)
@@ -1917,7 +2262,7 @@ class MainWindow(QMainWindow):
                     # Keine invaliden Zeichen mehr -> Kategorie zurücksetzen
                     self._highlight_categories(set())
 
-    def _get_category_path_for_zeichen(self, item: ZeichenTreeItem) -> str:
+    def _get_category_path_for_zeichen(self, item: ZeichenTreeItem) -> tuple[str, ...]:
         """
         Ermittelt Kategorie-Pfad für ein Zeichen
 
@@ -1925,122 +2270,59 @@ class MainWindow(QMainWindow):
             item: Zeichen-Item
 
         Returns:
-            str: Kategorie-Pfad (z.B. "Gefahren > Akute" oder "Gefahren")
-                 Leerer String wenn keine Kategorie
+            tuple[str, ...]: Kategorie-Pfad (z.B. ("Gefahren", "Akute") oder ("Gefahren",))
+                             Leeres Tupel wenn keine Kategorie
         """
-        parts = []
-        current = item.parent()
-
-        while current is not None:
-            if isinstance(current, ZeichenTreeItem):
-                parts.insert(0, current.name)
-            current = current.parent()
-
-        return " > ".join(parts) if parts else ""
+        # PERFORMANCE: Beim Tree-Aufbau gecacht (Zeichen: Pfad der Parent-Kategorie)
+        return item._category_path
 
-    def _get_all_category_levels(self, category_path: str) -> set[str]:
+    def _get_all_category_levels(self, category_path: tuple[str, ...]) -> set[tuple[str, ...]]:
         """
         Ermittelt ALLE Kategorie-Ebenen für einen Pfad
 
         Beispiel:
-            Input:  "Jonas Köritz > Einrichtungen > Feuerwehr"
-            Output: {"Jonas Köritz",
-                     "Jonas Köritz > Einrichtungen",
-                     "Jonas Köritz > Einrichtungen > Feuerwehr"}
+            Input:  ("Jonas Köritz", "Einrichtungen", "Feuerwehr")
+            Output: {("Jonas Köritz",),
+                     ("Jonas Köritz", "Einrichtungen"),
+                     ("Jonas Köritz", "Einrichtungen", "Feuerwehr")}
 
         Args:
             category_path: Vollständiger Kategorie-Pfad
 
         Returns:
-            set[str]: Set aller Kategorie-Ebenen (inkl. aller Parent-Ebenen)
+            set[tuple[str, ...]]: Set aller Kategorie-Ebenen (inkl. aller Parent-Ebenen)
         """
-        if not category_path:
-            return set()
+        return {category_path[:i + 1] for i in range(len(category_path))}
 
-        parts = [p.strip() for p in category_path.split(">")]
-        all_levels = set()
-
-        # Baue alle Ebenen auf
-        current_path = ""
-        for i, part in enumerate(parts):
-            if i == 0:
-                current_path = part
-            else:
-                current_path += f" > {part}"
-            all_levels.add(current_path)
-
-        return all_levels
-
-    def _has_invalid_zeichen_in_category(self, category_path: str) -> bool:
+    def _has_invalid_zeichen_in_category(self, category_path: tuple[str, ...]) -> bool:
         """
         Prüft ob in einer Kategorie noch invalide Zeichen existieren
 
         Args:
-            category_path: Kategorie-Pfad (z.B. "Gefahren > Akute")
+            category_path: Kategorie-Pfad (z.B. ("Gefahren", "Akute"))
 
         Returns:
             bool: True wenn mindestens ein invalides Zeichen existiert
         """
-        # Alle Top-Level Items durchgehen
-        for i in range(self.tree_zeichen.topLevelItemCount()):
-            top_item = self.tree_zeichen.topLevelItem(i)
-            if isinstance(top_item, ZeichenTreeItem):
-                if self._has_invalid_zeichen_recursive(top_item, top_item.name, category_path):
-                    return True
-        return False
-
-    def _has_invalid_zeichen_recursive(
-        self,
-        item: ZeichenTreeItem,
-        current_path: str,
-        target_path: str
-    ) -> bool:
-        """
-        Rekursive Suche nach invaliden Zeichen in Kategorie
-
-        Args:
-            item: Aktuelles Item
-            current_path: Aktueller Pfad
-            target_path: Gesuchter Kategorie-Pfad
-
-        Returns:
-            bool: True wenn invalides Zeichen gefunden
-        """
-        # Wenn Zeichen: Prüfe ob invalid und in der richtigen Kategorie
-        if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
-            # Kategorie des Zeichens ermitteln
-            zeichen_category = self._get_category_path_for_zeichen(item)
-            if zeichen_category == target_path:
-                # Prüfe ob Zeichen aktiviert und invalid
-                if (item.checkState(0) == Qt.CheckState.Checked and
-                    item.params.modus in self.TEXT_MODES and
-                    item.params.text):
-                    # FIXED: font_size aus RuntimeConfig verwenden
-                    from runtime_config import get_config
-                    runtime_cfg = get_config()
-
-                    # Validiere
-                    is_valid, _ = self.validation_mgr.validate_text_length(
-                        text=item.params.text,
-                        modus=item.params.modus,
-                        zeichen_hoehe_mm=self.settings.zeichen.zeichen_hoehe_mm,
-                        zeichen_breite_mm=self.settings.zeichen.zeichen_breite_mm,
-                        sicherheitsabstand_mm=self.settings.zeichen.sicherheitsabstand_mm,
-                        font_size=runtime_cfg.font_size,  # FIXED: Aus RuntimeConfig statt DEFAULT_FONT_SIZE
-                        item_name=item.name
-                    )
-                    if not is_valid:
-                        return True
+        # PERFORMANCE: Ohne angehakte Zeichen in der Kategorie kann nichts invalide sein
+        category_item = self._category_item_by_path.get(category_path)
+        if category_item is None or category_item._checked_descendant_count == 0:
             return False
 
-        # Für Kategorien: Rekursiv in Kinder gehen
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if isinstance(child, ZeichenTreeItem):
-                child_path = f"{current_path} > {child.name}" if child.item_type != ZeichenTreeItem.TYPE_ZEICHEN else current_path
-                if self._has_invalid_zeichen_recursive(child, child_path, target_path):
-                    return True
+        text_modes = self.TEXT_MODES
+        for item in self._all_zeichen_items:
+            # Nur direkte Zeichen der Kategorie (Pfad = Parent-Kategorie)
+            if item._category_path != category_path:
+                continue
 
+            # Prüfe ob Zeichen aktiviert und invalid
+            if (item.checkState(0) == Qt.CheckState.Checked and
+                item.params.modus in text_modes and
+                item.params.text):
+                # Validiere (PERFORMANCE: gecacht)
+                is_valid, _ = self._validate_text_cached(item.params.text, item.params.modus, item.name)
+                if not is_valid:
+                    return True
         return False
 
     def _reset_validation_warning_flag_delayed(self):
@@ -2048,23 +2330,14 @@ class MainWindow(QMainWindow):
         Setzt das Warnungs-Flag mit Verzögerung zurück
 
         Verhindert mehrfache Warnungen wenn mehrere Events fast gleichzeitig kommen.
-        Das Flag wird nach 500ms zurückgesetzt.
+        Das Flag wird nach VALIDATION_WARNING_RESET_MS zurückgesetzt.
         """
-        # Stoppe bestehenden Timer falls vorhanden
-        if self._validation_warning_timer is not None:
-            self._validation_warning_timer.stop()
-            self._validation_warning_timer = None
-
-        # Starte neuen Timer (500ms)
-        self._validation_warning_timer = QTimer()
-        self._validation_warning_timer.setSingleShot(True)
-        self._validation_warning_timer.timeout.connect(self._reset_validation_warning_flag)
-        self._validation_warning_timer.start(500)  # 500ms Debounce
+        # start() auf laufendem Timer startet das Intervall neu (Debounce)
+        self._validation_warning_timer.start()
 
     def _reset_validation_warning_flag(self):
         """Setzt das Warnungs-Flag zurück (wird von Timer aufgerufen)"""
         self._validation_warning_shown = False
-        self._validation_warning_timer = None
 
     def _reset_validation_highlight(self, item: ZeichenTreeItem):
         """
@@ -2078,39 +2351,58 @@ class MainWindow(QMainWindow):
 
         # Text-Widget zurücksetzen
         if 'text' in item.widgets:
-            item.widgets['text'].setStyleSheet("")
+            self._set_text_error_style(item, False)
+
+    def _iter_zeichen_descendants(self, item: ZeichenTreeItem) -> Iterator[ZeichenTreeItem]:
+        """
+        Liefert alle Zeichen unterhalb eines Items (iterative Breitensuche)
+
+        Args:
+            item: Tree-Item (Kategorie oder Unterkategorie)
+
+        Yields:
+            ZeichenTreeItem: Zeichen-Items (keine Kategorien)
+        """
+        queue = deque([item])
+        while queue:
+            current = queue.popleft()
+            for i in range(current.childCount()):
+                child = current.child(i)
+                if not isinstance(child, ZeichenTreeItem):
+                    continue
+                if child.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
+                    yield child
+                else:
+                    queue.append(child)
 
     def _apply_dateiname_to_children(self, item: ZeichenTreeItem):
         """
-        Befüllt rekursiv alle Kinder mit Dateiname-Modus mit Text aus Dateinamen
+        Befüllt alle Kinder mit Dateiname-Modus mit Text aus Dateinamen
+
+        PERFORMANCE: Flacher Durchlauf über alle Zeichen. Der Aufrufer
+        bündelt die Repaints über _bulk_tree_update().
 
         Args:
             item: Tree-Item (Kategorie oder Unterkategorie)
         """
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if isinstance(child, ZeichenTreeItem):
-                # Für Zeichen: Text aus Dateiname setzen
-                if (child.item_type == ZeichenTreeItem.TYPE_ZEICHEN and
-                    child.params.modus == "dateiname"):
-
-                    # Dateiname als Text
-                    filename = child.svg_path.stem if hasattr(child, 'svg_path') and child.svg_path else child.name
-                    if filename.endswith('.svg'):
-                        filename = filename[:-4]
-                    text = filename.replace("_", " ")
-
-                    # Text setzen (OHNE Einzelvalidierung - das passiert später in Batch)
-                    child.params.text = text
-                    if 'text' in child.widgets:
-                        # FIXED: Signale blockieren um Einzel-Validierung zu vermeiden
-                        child.widgets['text'].blockSignals(True)
-                        child.widgets['text'].setText(text)
-                        child.widgets['text'].blockSignals(False)
-
-                # Rekursiv für Unterkategorien
-                if child.item_type != ZeichenTreeItem.TYPE_ZEICHEN:
-                    self._apply_dateiname_to_children(child)
+        # Einmal trennen statt pro Zeichen (referenzgezählt, auch im Modus-Wechsel verschachtelt)
+        with self._block_item_changed():
+            for child in self._iter_zeichen_descendants(item):
+                if child.params.modus != "dateiname":
+                    continue
+
+                # Dateiname als Text (PERFORMANCE: vorberechnet)
+                text = self._get_dateiname_text(child)
+
+                # Text setzen (OHNE Einzelvalidierung - das passiert später in Batch)
+                child.params.text = text
+
+                # Zeichen mit Widgets haben immer ein Textfeld (lazy: evtl. noch keine Widgets)
+                if child.widgets:
+                    line_text = child.widgets['text']
+                    # FIXED: Signale blockieren um Einzel-Validierung zu vermeiden
+                    with QSignalBlocker(line_text):
+                        line_text.setText(text)
 
     def _on_vorlagen_ordner_oeffnen(self):
         """Vorlagen-Ordner oeffnen Dialog"""
@@ -2136,9 +2428,6 @@ class MainWindow(QMainWindow):
     def _on_ausgabe_ordner_oeffnen(self):
         """Oeffnet Ausgabe-Ordner im Dateimanager"""
         # NEW: Ausgabe-Ordner im Dateimanager öffnen
-        import subprocess
-        from constants import EXPORT_DIR
-
         if not EXPORT_DIR.exists():
             msg_box = QMessageBox(self)
             msg_box.setIcon(QMessageBox.Icon.Question)
@@ -2163,8 +2452,11 @@ class MainWindow(QMainWindow):
                 return
 
         try:
-            # Dateimanager öffnen
-            subprocess.run([filemanager(), str(EXPORT_DIR)])
+            # PERFORMANCE: Plattform-nativ über Qt öffnen (kein Prozessstart),
+            # externer Dateimanager nur als Fallback
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(EXPORT_DIR))):
+                self.logger.warning("QDesktopServices konnte Ausgabe-Ordner nicht öffnen - nutze Dateimanager")
+                subprocess.run([filemanager(), str(EXPORT_DIR)])
             self.logger.info(f"Ausgabe-Ordner geöffnet: {EXPORT_DIR}")
         except Exception as e:
             self.logger.error(f"Fehler beim Öffnen des Ausgabe-Ordners: {e}")
@@ -2180,13 +2472,16 @@ class MainWindow(QMainWindow):
 
         Zeigt Warnung an, wenn konfigurierte Schriftart nicht verfügbar ist
         """
-        from font_manager import FontManager
-
         # FIXED: font_family aus RuntimeConfig verwenden
-        runtime_cfg = get_config()
+        runtime_cfg = self._runtime_cfg
+
+        # PERFORMANCE: Bereits geprüfte Schriftart nicht erneut enumerieren
+        if runtime_cfg.font_family in self._font_check_cache:
+            return
 
         font_mgr = FontManager()
         actual_font, needs_warning = font_mgr.check_and_get_font(runtime_cfg.font_family)
+        self._font_check_cache[runtime_cfg.font_family] = (actual_font, needs_warning)
 
         if needs_warning:
             self.logger.warning(f"Schriftart '{runtime_cfg.font_family}' nicht verfügbar! Verwende '{actual_font}'")
@@ -2215,49 +2510,45 @@ class MainWindow(QMainWindow):
     def _on_neu_laden_delayed(self):
         """
         Verzögertes Laden der Kategorien (für bessere UX beim Programmstart)
-        Zeigt animierte Statusmeldung während des Ladens
-        """
-        from PyQt6.QtWidgets import QApplication
-        from PyQt6.QtCore import QTimer
-
-        # Animierte Statusmeldung
-        self._loading_dots = 0
-        self._loading_timer = QTimer()
-        self._loading_timer.timeout.connect(self._update_loading_status)
-        self._loading_timer.start(500)  # Alle 500ms aktualisieren
 
+        CHANGED: Statusmeldung wird einmal gesetzt, Fortschritt zeigt der
+        Fortschrittsbalken in der Statusleiste (keine Punkte-Animation mehr)
+        """
         # Status anzeigen
-        self._update_statusbar("Lade Kategorien")
-        QApplication.processEvents()
+        self._update_statusbar("Lade Kategorien...")
 
         # Kurze Verzögerung, damit Status sichtbar wird
         QTimer.singleShot(50, self._on_neu_laden)
 
-    def _update_loading_status(self):
-        """Aktualisiert animierte Lade-Statusmeldung"""
-        self._loading_dots = (self._loading_dots + 1) % 4
-        dots = "." * self._loading_dots
-        self._update_statusbar(f"Lade Kategorien{dots}")
-
     def _on_neu_laden(self):
         """Laedt Kategorien/Zeichen neu"""
-        from PyQt6.QtWidgets import QApplication
-
-        # Loading-Animation stoppen falls aktiv
-        if hasattr(self, '_loading_timer') and self._loading_timer.isActive():
-            self._loading_timer.stop()
-
         self.logger.info("Lade Kategorien neu...")
         self._update_statusbar("Lade Kategorien...")
-        QApplication.processEvents()  # BUGFIX: UI aktualisieren
         self.tree_zeichen.clear()
+        self._validation_debouncer.stop()
+        self._pending_validation.clear()
+        self._invalid_leaves.clear()
+        self._last_search = ""  # Neuer Tree ist komplett sichtbar
+        self._widget_to_item.clear()
+        self._category_item_by_path.clear()
+        self._all_zeichen_items.clear()
+        self._all_category_items.clear()
+        self._checked_zeichen_count = 0
+        self._checked_zeichen.clear()
 
         try:
             # CHANGED: scan_all_fast() - Kategorien UND SVGs in einem Durchlauf
             self._update_statusbar("Scanne Kategorien und SVGs...")
-            QApplication.processEvents()  # BUGFIX: UI aktualisieren
+            QApplication.processEvents()  # PERFORMANCE: Einziges processEvents() vor dem langen Scan
             all_data = self.svg_loader.scan_all_fast()
 
+            # PERFORMANCE: Anzeige-Namen und Dateiname-Texte vor dem Qt-Aufbau berechnen
+            self._display_cache = {
+                svg_path: (self._compute_display_name(svg_path), self._filename_to_text(svg_path, svg_path.stem))
+                for svg_paths in all_data.values()
+                for svg_path in svg_paths
+            }
+
             if not all_data:
                 self.statusbar.showMessage(
                     f"Keine Kategorien in: {self.svg_loader.zeichen_dir}"
@@ -2266,13 +2557,11 @@ class MainWindow(QMainWindow):
 
             # Hierarchie aufbauen (mit bereits geladenen SVG-Daten)
             self._update_statusbar(f"Baue Hierarchie auf ({len(all_data)} Kategorien)...")
-            QApplication.processEvents()  # BUGFIX: UI aktualisieren
             self._build_tree_fast(all_data)
 
             # Statusbar aktualisieren
             total_svgs = sum(len(svgs) for svgs in all_data.values())
             self._update_statusbar("Kategorien erfolgreich geladen")
-            QApplication.processEvents()  # BUGFIX: UI aktualisieren
             self.logger.info("{} Kategorien mit {} SVGs geladen".format(len(all_data), total_svgs))
 
             # Export-Button aktivieren
@@ -2291,32 +2580,57 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Fehler", f"Beim Laden ist ein Fehler aufgetreten:\n{e}")
             return  # NEU: Verhindert weitere Ausführung bei Fehler
 
-    def _build_tree(self, categories: list):
+    def _get_display_name_for_zeichen(self, svg_path: Path) -> str:
+        """
+        Gibt den Display-Namen für ein Zeichen zurück (aus _display_cache)
+
+        Args:
+            svg_path: Pfad zur SVG-Datei (oder virtueller Blanko-Pfad)
+
+        Returns:
+            Display-Name für TreeView
+        """
+        cached = self._display_cache.get(svg_path)
+        if cached is not None:
+            return cached[0]
+        return self._compute_display_name(svg_path)
+
+    def _get_dateiname_text(self, item: ZeichenTreeItem) -> str:
         """
-        Baut Baum-Struktur auf
+        Gibt den Text für den Dateiname-Modus zurück (aus _display_cache)
 
         Args:
-            categories: Liste von Kategorie-Pfaden (z.B. ["Einheiten", "Formationen/Gruppen"])
+            item: Zeichen-Item
+
+        Returns:
+            str: Dateiname als Text ("Datei_Name.svg" -> "Datei Name")
         """
-        # Hierarchie-Dict: {kategorie: {unterkategorie: [...], zeichen: [...]}}
-        hierarchy = {}
+        cached = self._display_cache.get(item.svg_path) if item.svg_path else None
+        if cached is not None:
+            return cached[1]
+        return self._filename_to_text(item.svg_path, item.name)
 
-        for category in categories:
-            parts = category.split('/')
-            current_dict = hierarchy
+    @staticmethod
+    def _filename_to_text(svg_path: Optional[Path], fallback_name: str) -> str:
+        """
+        Berechnet Text für Dateiname-Modus: "Datei_Name.svg" -> "Datei Name"
 
-            # Hierarchie aufbauen
-            for part in parts:
-                if part not in current_dict:
-                    current_dict[part] = {}
-                current_dict = current_dict[part]
+        Args:
+            svg_path: Pfad zur SVG-Datei (None = fallback_name verwenden)
+            fallback_name: Item-Name, falls kein SVG-Pfad vorhanden
 
-        # Tree aufbauen
-        self._add_hierarchy_to_tree(hierarchy, None)
+        Returns:
+            str: Dateiname ohne Extension, Unterstriche durch Leerzeichen ersetzt
+        """
+        stem = svg_path.stem if svg_path else fallback_name
+        if stem.endswith('.svg'):
+            stem = stem[:-4]
+        return stem.translate(_UNDERSCORE_TRANS)  # PERFORMANCE: translate statt replace
 
-    def _get_display_name_for_zeichen(self, svg_path: Path) -> str:
+    @staticmethod
+    def _compute_display_name(svg_path: Path) -> str:
         """
-        Gibt den Display-Namen für ein Zeichen zurück
+        Berechnet den Display-Namen für ein Zeichen
 
         Für Blankozeichen werden die schönen Namen aus constants.py verwendet.
         Für normale Zeichen wird der Dateiname ohne Extension verwendet.
@@ -2340,36 +2654,20 @@ class MainWindow(QMainWindow):
         Baut Baum-Struktur schnell auf (mit bereits geladenen SVG-Daten)
 
         CHANGED: Nutzt scan_all_fast() Ergebnis - keine separaten get_svgs_in_category() Calls!
+        PERFORMANCE: Ein Durchlauf über die sortierten Kategorie-Pfade mit Pfad-Stack
+        statt Zwischenaufbau eines verschachtelten Hierarchie-Dicts.
+        Reihenfolge wie bisher: Kategorie, dann Unterkategorien, dann eigene Zeichen.
 
         Args:
             all_data: Dict[str, List[Path]] - Kategorien mit ihren SVG-Pfaden
         """
-        from PyQt6.QtWidgets import QApplication
-        from datetime import datetime
-
-        # LOGGING: Start des GUI-Aufbaus
-        start_time = datetime.now()
+        # LOGGING: Start des GUI-Aufbaus (PERFORMANCE: monotone Zeitmessung)
+        start_ns = time.perf_counter_ns()
         total_items = sum(len(svgs) for svgs in all_data.values())
         self.logger.info("Starte GUI-Aufbau: {} Kategorien, {} Zeichen".format(
             len(all_data), total_items
         ))
 
-        # Hierarchie-Dict mit SVG-Pfaden: {kategorie: {unterkategorie: {...}, svgs: [...]}}
-        hierarchy = {}
-
-        for category, svg_paths in all_data.items():
-            parts = category.split('/')
-            current_dict = hierarchy
-
-            # Hierarchie aufbauen
-            for part in parts:
-                if part not in current_dict:
-                    current_dict[part] = {}
-                current_dict = current_dict[part]
-
-            # SVG-Pfade am Endpunkt speichern
-            current_dict['__svgs__'] = svg_paths
-
         # PERFORMANCE: Updates deaktivieren während Tree-Aufbau
         self.tree_zeichen.setUpdatesEnabled(False)
 
@@ -2378,223 +2676,208 @@ class MainWindow(QMainWindow):
         self.tree_zeichen.blockSignals(True)
 
         try:
-            # Item-Counter für Batch-Processing
+            # Item-Counter für Fortschrittsanzeige
             self._item_counter = 0
 
-            # Tree aufbauen (mit SVG-Daten)
-            self._add_hierarchy_to_tree_fast(hierarchy, None, total_items)
+            # PERFORMANCE: processEvents() zeitbasiert drosseln (statt alle N Items)
+            self._ui_update_timer = QElapsedTimer()
+            self._ui_update_timer.start()
+
+            # Fortschrittsbalken zurücksetzen und einblenden
+            self.progress_loading.setValue(0)
+            self.progress_loading.show()
+
+            # PERFORMANCE: Attribut-Lookups aus der Schleife ziehen
+            add_top_level_item = self.tree_zeichen.addTopLevelItem
+            create_item_widgets = self._create_item_widgets
+            mark_item_needs_widgets = self._mark_item_needs_widgets
+            category_item_by_path = self._category_item_by_path
+            all_category_items = self._all_category_items
+            append_zeichen_items = self._append_zeichen_items
+
+            # Pfad-Stack der offenen Kategorien: (Kategorie-Item, eigene SVG-Pfade)
+            # Zeichen werden erst angehängt, wenn der Teilbaum verlassen wird
+            # (dadurch stehen sie wie bisher unter den Unterkategorien)
+            open_categories: list[tuple[ZeichenTreeItem, list]] = []
+
+            # Nach Pfad-Teilen sortiert: Eltern vor Kindern, Geschwister alphabetisch
+            for category, svg_paths in sorted(all_data.items(), key=lambda kv: kv[0].split('/')):
+                parts = tuple(category.split('/'))
+
+                # Verlassene Teilbäume abschließen (Stack auf gemeinsamen Präfix kürzen)
+                while open_categories and (
+                    len(open_categories) > len(parts)
+                    or open_categories[-1][0]._category_path != parts[:len(open_categories)]
+                ):
+                    append_zeichen_items(*open_categories.pop(), total_items)
+
+                # Fehlende Ebenen anlegen (Zwischenebenen ohne eigene SVGs)
+                for depth in range(len(open_categories), len(parts)):
+                    item_path = parts[:depth + 1]
+                    if depth == 0:
+                        # Top-Level Kategorie (Widgets sofort, da initial sichtbar)
+                        item = create_category_item(parts[depth])
+                        add_top_level_item(item)
+                        create_item_widgets(item)
+                    else:
+                        # Unterkategorie (PERFORMANCE: Widgets erst beim Aufklappen)
+                        item = create_subcategory_item(parts[depth], open_categories[-1][0])
+                        mark_item_needs_widgets(item)
+
+                    # PERFORMANCE: Kategorie-Item für direkten Pfad-Zugriff registrieren
+                    item._category_path = item_path
+                    category_item_by_path[item_path] = item
+                    all_category_items.append(item)
+                    open_categories.append((item, []))
+
+                # SVG-Pfade gehören zur untersten Ebene
+                open_categories[-1][1].extend(svg_paths)
+
+            # Restliche offene Kategorien abschließen
+            while open_categories:
+                append_zeichen_items(*open_categories.pop(), total_items)
 
         finally:
             # PERFORMANCE: Signals wieder aktivieren
             self.tree_zeichen.blockSignals(old_block_state)
 
+            self.progress_loading.hide()
+
             # PERFORMANCE: Updates wieder aktivieren -> Einmaliges Render
             self.tree_zeichen.setUpdatesEnabled(True)
 
             # LOGGING: Ende des GUI-Aufbaus
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             self.logger.info("GUI-Aufbau abgeschlossen in {:.2f}s".format(elapsed))
 
-    def _add_hierarchy_to_tree_fast(self, hierarchy_dict: dict, parent_item: Optional[QTreeWidgetItem], total_items: int = 0):
+    def _append_zeichen_items(self, item: ZeichenTreeItem, svg_paths: list, total_items: int):
         """
-        Fuegt Hierarchie rekursiv zum Tree hinzu (mit bereits geladenen SVG-Daten)
-
-        CHANGED: SVG-Daten sind bereits vorhanden - kein _load_zeichen_for_item() mehr noetig!
+        Hängt die Zeichen einer Kategorie an (Teil von _build_tree_fast)
 
         Args:
-            hierarchy_dict: Hierarchie-Dictionary mit '__svgs__' keys
-            parent_item: Parent-Item (None = Root)
+            item: Kategorie-Item
+            svg_paths: SVG-Pfade der Kategorie
             total_items: Gesamt-Anzahl Items für Fortschrittsanzeige
         """
-        from PyQt6.QtWidgets import QApplication
-
-        for name, sub_dict in sorted(hierarchy_dict.items()):
-            # __svgs__ ueberspringen (wird separat verarbeitet)
-            if name == '__svgs__':
-                continue
-
-            # Item erstellen
-            if parent_item is None:
-                # Top-Level Kategorie
-                item = create_category_item(name)
-                self.tree_zeichen.addTopLevelItem(item)
-            else:
-                # Unterkategorie
-                item = create_subcategory_item(name, parent_item)
-
-            # Widgets in Spalten erstellen
-            self._create_item_widgets(item)
-
-            # Rekursiv Kinder hinzufuegen
-            if sub_dict:
-                self._add_hierarchy_to_tree_fast(sub_dict, item, total_items)
-
-            # CHANGED: Zeichen direkt aus Hierarchie laden (nicht mehr scannen!)
-            if '__svgs__' in sub_dict:
-                for svg_path in sub_dict['__svgs__']:
-                    # Verwende schönen Display-Namen (für Blankozeichen aus constants.py)
-                    display_name = self._get_display_name_for_zeichen(svg_path)
-                    zeichen_item = create_zeichen_item(display_name, svg_path, item)
-                    self._create_item_widgets(zeichen_item)
-
-                    # PERFORMANCE: Batch-Processing - UI-Update alle 100 Items
-                    self._item_counter += 1
-                    if self._item_counter % GUI_BATCH_UPDATE_INTERVAL == 0:
-                        # Fortschritt anzeigen
-                        progress_pct = int((self._item_counter / total_items) * 100)
-                        self._update_statusbar("Baue Hierarchie auf... {}% ({}/{})".format(
-                            progress_pct, self._item_counter, total_items
-                        ))
-                        QApplication.processEvents()  # UI responsive halten
+        # PERFORMANCE: Attribut-Lookups aus der Schleife ziehen
+        mark_item_needs_widgets = self._mark_item_needs_widgets
+        get_display_name = self._get_display_name_for_zeichen
+        all_zeichen_items = self._all_zeichen_items
+        path = item._category_path
 
-            # Anzahl aktualisieren
-            item.update_anzahl()
+        # CHANGED: Zeichen direkt aus Scan-Ergebnis laden (nicht mehr scannen!)
+        for svg_path in svg_paths:
+            # Verwende schönen Display-Namen (für Blankozeichen aus constants.py)
+            zeichen_item = create_zeichen_item(get_display_name(svg_path), svg_path, item)
+            zeichen_item._category_path = path
+            zeichen_item._tree_index = len(all_zeichen_items)
+            all_zeichen_items.append(zeichen_item)
+            # PERFORMANCE: Widgets erst beim Aufklappen erstellen
+            mark_item_needs_widgets(zeichen_item)
+
+            # PERFORMANCE: UI-Update höchstens alle GUI_PROCESS_EVENTS_INTERVAL_MS
+            self._item_counter += 1
+            if self._ui_update_timer.elapsed() >= GUI_PROCESS_EVENTS_INTERVAL_MS:
+                # Fortschritt anzeigen (PERFORMANCE: Balken statt neuer Statustext)
+                self.progress_loading.setValue(int((self._item_counter / total_items) * 100))
+                QApplication.processEvents()  # UI responsive halten
+                self._ui_update_timer.restart()
+
+        # Anzahl aktualisieren
+        item.update_anzahl()
 
-    def _add_hierarchy_to_tree(self, hierarchy_dict: dict, parent_item: Optional[QTreeWidgetItem]):
+    def _get_category_path(self, item: QTreeWidgetItem) -> str:
         """
-        Fuegt Hierarchie rekursiv zum Tree hinzu
+        Gibt Kategorie-Pfad fuer Item zurueck
 
         Args:
-            hierarchy_dict: Hierarchie-Dictionary
-            parent_item: Parent-Item (None = Root)
-        """
-        for name, sub_dict in sorted(hierarchy_dict.items()):
-            # Item erstellen
-            if parent_item is None:
-                # Top-Level Kategorie
-                item = create_category_item(name)
-                self.tree_zeichen.addTopLevelItem(item)
-            else:
-                # Unterkategorie oder Zeichen
-                # Pruefen ob Zeichen oder Unterkategorie
-                # (Zeichen = .svg Datei, Unterkategorie = Ordner)
-                if name.endswith('.svg'):
-                    # Zeichen
-                    category_path = self._get_category_path(parent_item)
-                    svg_path = self.svg_loader.zeichen_dir / category_path / name
-                    # Verwende schönen Display-Namen (für Blankozeichen aus constants.py)
-                    display_name = self._get_display_name_for_zeichen(svg_path)
-                    item = create_zeichen_item(display_name, svg_path, parent_item)
-                else:
-                    # Unterkategorie
-                    item = create_subcategory_item(name, parent_item)
-
-            # Widgets in Spalten erstellen
-            self._create_item_widgets(item)
-
-            # Rekursiv Kinder hinzufuegen
-            if sub_dict:
-                self._add_hierarchy_to_tree(sub_dict, item)
-
-            # Zeichen laden (falls Kategorie/Unterkategorie)
-            if item.item_type != ZeichenTreeItem.TYPE_ZEICHEN:
-                self._load_zeichen_for_item(item)
+            item: Tree-Item
 
-            # Anzahl aktualisieren
-            item.update_anzahl()
+        Returns:
+            str: Kategorie-Pfad (z.B. "Formationen/Gruppen")
+                 Bei Zeichen: Pfad der Parent-Kategorie
+        """
+        # PERFORMANCE: Beim Tree-Aufbau gecacht statt Parent-Kette abzulaufen
+        return '/'.join(getattr(item, '_category_path', ()))
 
-    def _load_zeichen_for_item(self, item: ZeichenTreeItem):
+    def _create_item_widgets(self, item: ZeichenTreeItem):
         """
-        Laedt Zeichen fuer Kategorie/Unterkategorie
+        Erstellt Widgets fuer Item-Spalten sofort (Defaults + Widgets)
 
         Args:
-            item: Kategorie/Unterkategorie-Item
+            item: Tree-Item
         """
-        category_path = self._get_category_path(item)
-        zeichen_paths = self.svg_loader.get_svgs_in_category(category_path)
+        self._mark_item_needs_widgets(item)
+        self._materialize_item_widgets(item)
 
-        for svg_path in zeichen_paths:
-            # Verwende schönen Display-Namen (für Blankozeichen aus constants.py)
-            display_name = self._get_display_name_for_zeichen(svg_path)
-            zeichen_item = create_zeichen_item(display_name, svg_path, item)
-            self._create_item_widgets(zeichen_item)
-
-    def _get_category_path(self, item: QTreeWidgetItem) -> str:
+    def _mark_item_needs_widgets(self, item: ZeichenTreeItem):
         """
-        Gibt Kategorie-Pfad fuer Item zurueck
+        Setzt Default-Parameter für ein Item ohne Widgets zu erstellen
+
+        PERFORMANCE: Widgets werden erst beim Aufklappen des Parents erstellt
+        (_on_item_expanded -> _materialize_item_widgets).
 
         Args:
             item: Tree-Item
-
-        Returns:
-            str: Kategorie-Pfad (z.B. "Formationen/Gruppen")
         """
-        parts = []
-        current = item
+        # v7.1.1: Standard-Modus aus RuntimeConfig setzen (für alle Zeichen)
+        default_modus = self._runtime_cfg.standard_modus
 
-        while current is not None:
-            if isinstance(current, ZeichenTreeItem):
-                parts.insert(0, current.name)
-            current = current.parent()
+        # NEW: Bei Blanko-Zeichen den passenden Modus vorauswählen (überschreibt Standard)
+        if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN and item.svg_path:
+            # PERFORMANCE: get_blanko_modus ist pro Pfad gecacht (lru_cache im SVGLoaderLocal)
+            blanko_modus = self.svg_loader.get_blanko_modus(item.svg_path)
+            if blanko_modus:
+                default_modus = blanko_modus  # Blanko-Modus hat Vorrang
 
-        return '/'.join(parts)
+        item.params.modus = default_modus
 
-    def _create_item_widgets(self, item: ZeichenTreeItem):
+    def _materialize_item_widgets(self, item: ZeichenTreeItem):
         """
-        Erstellt Widgets fuer Item-Spalten
+        Erstellt Widgets fuer Item-Spalten aus dem aktuellen Item-Zustand
+
+        Übernimmt Kopien, Modus, Text und Checkbox-Status aus dem Item, da
+        sich diese vor dem Erstellen (z.B. durch Propagierung) geändert haben können.
 
         Args:
             item: Tree-Item
         """
         # CHANGED: Kopien-SpinBox (Spalte 1) - Jetzt auch für Kategorien!
-        from PyQt6.QtWidgets import QSpinBox
-        spin_kopien = QSpinBox()
+        # FIXED: Blockiert Scrollrad + Cursortasten (PERFORMANCE: ohne EventFilter pro Widget)
+        spin_kopien = NoScrollSpinBox()
         spin_kopien.setMinimum(1)
         spin_kopien.setMaximum(999)
-        spin_kopien.setValue(1)
+        spin_kopien.setValue(item.anzahl_kopien)
 
-        # FIXED: EventFilter installieren (blockiert Scrollrad + Cursortasten)
-        spin_kopien.installEventFilter(self.no_scroll_filter)
-
-        # Bei Zeichen: Initial deaktiviert bis ausgewählt
+        # Bei Zeichen: Deaktiviert bis ausgewählt
         # Bei Kategorien: Immer aktiviert
         if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
-            spin_kopien.setEnabled(False)
+            spin_kopien.setEnabled(item.is_checked())
 
         # PERFORMANCE: Signal erst NACH setValue verbinden (vermeidet Signal-Emission)
-        spin_kopien.valueChanged.connect(
-            lambda val, i=item: self._on_kopien_changed(i, val)
-        )
+        self._widget_to_item[id(spin_kopien)] = item
+        spin_kopien.valueChanged.connect(self._slot_kopien)
         self.tree_zeichen.setItemWidget(item, ZeichenTreeItem.COL_ANZAHL, spin_kopien)
 
         # Modus-ComboBox (Spalte 2)
         # Labels werden aus modus_config.py geladen (Master-Definitionen)
-        combo_modus = QComboBox()
-        combo_modus.addItems(get_modus_gui_labels())
-
-        # FIXED: EventFilter installieren (blockiert Scrollrad + Cursortasten)
-        combo_modus.installEventFilter(self.no_scroll_filter)
-
-        # v7.1.1: Standard-Modus aus RuntimeConfig setzen (für alle Zeichen)
-        config = get_config()
-        default_modus = config.standard_modus
+        # FIXED: Blockiert Scrollrad + Cursortasten (PERFORMANCE: ohne EventFilter pro Widget)
+        combo_modus = NoScrollComboBox()
+        combo_modus.setModel(self._shared_modus_model)  # PERFORMANCE: Gemeinsames Modell
 
-        # NEW: Bei Blanko-Zeichen den passenden Modus vorauswählen (überschreibt Standard)
-        if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN and item.svg_path:
-            blanko_modus = self.svg_loader.get_blanko_modus(item.svg_path)
-            if blanko_modus:
-                default_modus = blanko_modus  # Blanko-Modus hat Vorrang
-
-        # Modus setzen (entweder Blanko-Modus oder Standard aus RuntimeConfig)
-        gui_label = internal_to_gui(default_modus)
-        index = combo_modus.findText(gui_label)
-        if index >= 0:
-            combo_modus.setCurrentIndex(index)
-            # Auch im Item-Params speichern
-            item.params.modus = default_modus
+        # Modus aus Item-Params (Default in _mark_item_needs_widgets gesetzt)
+        combo_modus.setCurrentIndex(self._modus_to_index(item.params.modus))
 
         # PERFORMANCE: Signal erst NACH setCurrentIndex verbinden
-        combo_modus.currentTextChanged.connect(
-            lambda text, i=item: self._on_modus_changed(i, text)
-        )
+        self._widget_to_item[id(combo_modus)] = item
+        combo_modus.currentTextChanged.connect(self._slot_modus)
         self.tree_zeichen.setItemWidget(item, ZeichenTreeItem.COL_MODUS, combo_modus)
 
         # Text-Eingabe (Spalte 3)
         line_text = QLineEdit()
-        line_text.setPlaceholderText("OV-Name")  # Default: OV+Staerke
-        line_text.textChanged.connect(
-            lambda text, i=item: self._on_text_changed(i, text)
-        )
+        line_text.setText(item.params.text)
+        self._widget_to_item[id(line_text)] = item
+        line_text.textChanged.connect(self._slot_text)
         self.tree_zeichen.setItemWidget(item, ZeichenTreeItem.COL_TEXT, line_text)
 
         # v7.1: Grafik-Parameter sind jetzt global, keine per-Item-Widgets mehr
@@ -2604,6 +2887,59 @@ class MainWindow(QMainWindow):
             'text': line_text,
             'kopien': spin_kopien
         }
+        item._widgets_built = True
+
+        # Neue Widgets sind ungestylt - Stil-Zustände neu anwenden lassen
+        item._last_row_style_state = None
+        item._last_text_style_state = None
+
+        # Platzhalter + Aktiv-Status passend zum Modus
+        self._update_text_placeholder(item, item.params.modus)
+
+        # Validierungs-Hervorhebung nachziehen (Zeile wurde ohne Widgets schon markiert)
+        # FIXED: _invalid_leaves ist der maßgebliche Fehlerzustand (statt Fettschrift als Marker)
+        if id(item) in self._invalid_leaves:
+            self._highlight_row(item, error=True)
+            self._set_text_error_style(item, True)
+
+    def _modus_to_index(self, modus: str) -> int:
+        """
+        Gibt ComboBox-Index für internen Modus zurück
+
+        Args:
+            modus: Interner Modus (z.B. "ov_staerke")
+
+        Returns:
+            int: Index im gemeinsamen Modus-Modell (unbekannt -> Fallback-Label wie internal_to_gui)
+        """
+        index = self._internal_to_index.get(modus)
+        if index is None:
+            index = self._modus_labels.index(internal_to_gui(modus))
+        return index
+
+    def _slot_kopien(self, anzahl: int):
+        """Gemeinsamer Slot für alle Kopien-SpinBoxen (Item über sender())"""
+        self._on_kopien_changed(self._widget_to_item[id(self.sender())], anzahl)
+
+    def _slot_modus(self, modus_text: str):
+        """Gemeinsamer Slot für alle Modus-ComboBoxen (Item über sender())"""
+        self._on_modus_changed(self._widget_to_item[id(self.sender())], modus_text)
+
+    def _slot_text(self, text: str):
+        """Gemeinsamer Slot für alle Text-Felder (Item über sender())"""
+        self._on_text_changed(self._widget_to_item[id(self.sender())], text)
+
+    def _on_item_expanded(self, item: QTreeWidgetItem):
+        """
+        Item wurde aufgeklappt: Widgets der Kinder erstellen (lazy)
+
+        Args:
+            item: Aufgeklapptes Tree-Item
+        """
+        for i in range(item.childCount()):
+            child = item.child(i)
+            if isinstance(child, ZeichenTreeItem) and not child._widgets_built:
+                self._materialize_item_widgets(child)
 
     def _on_kopien_changed(self, item: ZeichenTreeItem, anzahl: int):
         """
@@ -2636,8 +2972,8 @@ class MainWindow(QMainWindow):
         # CRITICAL FIX: Disconnect itemChanged während Modus-Wechsel
         # _highlight_row() und _highlight_categories() ändern Items was itemChanged triggert!
         # Das würde fälschlicherweise alle Checkboxen löschen
-        self.tree_zeichen.itemChanged.disconnect(self._on_item_changed)
-        try:
+        # PERFORMANCE: Referenzgezählt - verschachtelte Aufrufe trennen/verbinden nicht erneut
+        with self._block_item_changed():
             # Modus-Text -> Internal (aus modus_config.py)
             modus = gui_to_internal(modus_text)
 
@@ -2649,9 +2985,8 @@ class MainWindow(QMainWindow):
             if item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
                 item.params.text = ""
                 if 'text' in item.widgets:
-                    item.widgets['text'].blockSignals(True)
-                    item.widgets['text'].setText("")
-                    item.widgets['text'].blockSignals(False)
+                    with QSignalBlocker(item.widgets['text']):
+                        item.widgets['text'].setText("")
 
             # FIXED: Validierung überspringen wenn Initialisierung noch läuft
             if not self._initialization_complete:
@@ -2668,69 +3003,21 @@ class MainWindow(QMainWindow):
 
             # SPECIAL: Bei Dateiname-Modus automatisch Text aus Dateiname setzen
             if modus == "dateiname" and item.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
-                # Dateiname als Text: "Datei_Name.svg" → "Datei Name"
-                filename = item.svg_path.stem if hasattr(item, 'svg_path') and item.svg_path else item.name
-                if filename.endswith('.svg'):
-                    filename = filename[:-4]
-                text = filename.replace("_", " ")
+                # Dateiname als Text: "Datei_Name.svg" → "Datei Name" (PERFORMANCE: vorberechnet)
+                text = self._get_dateiname_text(item)
 
                 # Text setzen (OHNE Validierung hier - wird von _on_text_changed() übernommen)
                 item.params.text = text
                 if 'text' in item.widgets:
                     # FIXED: Signale blockieren um doppelte Validierung zu vermeiden
-                    item.widgets['text'].blockSignals(True)
-                    item.widgets['text'].setText(text)
-                    item.widgets['text'].blockSignals(False)
+                    with QSignalBlocker(item.widgets['text']):
+                        item.widgets['text'].setText(text)
 
                 # FIXED: Validierung nur wenn Zeichen AKTIVIERT ist
+                # PERFORMANCE: Entprellt - mehrere Modus-Wechsel werden in _flush_validation() gesammelt geprüft
                 if is_checked:
-                    # FIXED: font_size aus RuntimeConfig verwenden
-                    from runtime_config import get_config
-                    runtime_cfg = get_config()
-
-                    # Validierung durchführen
-                    is_valid, error_msg = self.validation_mgr.validate_text_length(
-                        text=text,
-                        modus=modus,
-                        zeichen_hoehe_mm=self.settings.zeichen.zeichen_hoehe_mm,
-                        zeichen_breite_mm=self.settings.zeichen.zeichen_breite_mm,
-                        sicherheitsabstand_mm=self.settings.zeichen.sicherheitsabstand_mm,
-                        font_size=runtime_cfg.font_size,  # FIXED: Aus RuntimeConfig statt DEFAULT_FONT_SIZE
-                        item_name=item.name
-                    )
-
-                    if is_valid:
-                        # Text ist gueltig -> Zeile zurücksetzen
-                        self._highlight_row(item, error=False)
-                        if 'text' in item.widgets:
-                            item.widgets['text'].setStyleSheet("")
-                    else:
-                        # Text ist zu lang -> ROT einfaerben
-                        self._highlight_row(item, error=True)
-                        if 'text' in item.widgets:
-                            item.widgets['text'].setStyleSheet(
-                                f"background-color: {VALIDATION_ERROR_BG}; "
-                                f"color: {VALIDATION_ERROR_FG}; "
-                                f"font-weight: bold;"
-                            )
-
-                        # FIXED: Kategorie-Hervorhebung auch bei Dateiname-Modus
-                        category_path = self._get_category_path_for_zeichen(item)
-                        if category_path:
-                            # FIXED: Alle Ebenen im Pfad hervorheben
-                            all_category_paths = self._get_all_category_levels(category_path)
-                            self._highlight_categories(all_category_paths)
-
-                        # Warnung NUR anzeigen wenn nicht bereits eine gezeigt wird
-                        if not self._batch_operation_active and not self._validation_warning_shown:
-                            self._validation_warning_shown = True
-                            self.validation_mgr.show_validation_warning(
-                                self,
-                                "Dateiname zu lang",
-                                error_msg + "\n\nDer Text wurde ROT markiert.\nBitte kürze den Text manuell!"
-                            )
-                            # FIXED: Flag mit Timer zurücksetzen (500ms Debounce)
-                            self._reset_validation_warning_flag_delayed()
+                    self._pending_validation[id(item)] = item
+                    self._validation_debouncer.start()
 
             # Textfeld-Platzhalter anpassen
             self._update_text_placeholder(item, modus)
@@ -2740,7 +3027,7 @@ class MainWindow(QMainWindow):
             if modus != "dateiname":
                 self._highlight_row(item, error=False)
                 if 'text' in item.widgets:
-                    item.widgets['text'].setStyleSheet("")
+                    self._set_text_error_style(item, False)
 
             # v7.1: Grafik-Felder-Verwaltung entfernt (keine per-Item-Grafik-Widgets mehr)
 
@@ -2748,25 +3035,78 @@ class MainWindow(QMainWindow):
             if item.item_type != ZeichenTreeItem.TYPE_ZEICHEN:
                 # NEW: Batch-Modus aktivieren (unterdrückt Einzelwarnungen)
                 self._batch_operation_active = True
+                try:
+                    # PERFORMANCE: Propagierung + Dateiname-Texte ohne Zwischen-Repaints
+                    # (Validierung danach, da sie ggf. eine Warnung anzeigt)
+                    with self._bulk_tree_update():
+                        # PERFORMANCE: Params + Widgets in einem Durchlauf
+                        item.propagate_and_refresh_children(self._refresh_child_widgets)
 
-                item.propagate_params_to_children()
-                self._update_children_widgets(item)
+                        # NEW: Nach Modus-Propagierung Batch-Validierung für Text-Modi
+                        if modus == "dateiname":
+                            # Spezial: Bei Dateiname-Modus erstmal alle Kinder mit Text befüllen
+                            self._apply_dateiname_to_children(item)
 
-                # NEW: Nach Modus-Propagierung Batch-Validierung für Text-Modi
-                if modus == "dateiname":
-                    # Spezial: Bei Dateiname-Modus erstmal alle Kinder mit Text befüllen
-                    self._apply_dateiname_to_children(item)
+                    # NEW: Batch-Validierung für alle Kinder mit Text-Modi
+                    if modus in self.TEXT_MODES:
+                        self._validate_all_text_lengths()
+                finally:
+                    # NEW: Batch-Modus deaktivieren
+                    self._batch_operation_active = False
 
-                # NEW: Batch-Validierung für alle Kinder mit Text-Modi
-                if modus in self.TEXT_MODES:
-                    self._validate_all_text_lengths()
+    def _flush_validation(self):
+        """
+        Validiert alle seit dem letzten Durchlauf gesammelten Zeichen (Dateiname-Modus)
 
-                # NEW: Batch-Modus deaktivieren
-                self._batch_operation_active = False
+        PERFORMANCE: Wird vom Entprell-Timer aufgerufen. Kategorie-Hervorhebung
+        und Warnung erfolgen einmal für alle Zeichen statt pro Modus-Wechsel.
+        """
+        pending = self._pending_validation
+        self._pending_validation = {}
 
-        finally:
-            # CRITICAL: Signal immer wieder verbinden, auch bei Fehlern
-            self.tree_zeichen.itemChanged.connect(self._on_item_changed)
+        affected_categories: set[tuple[str, ...]] = set()
+        first_error: Optional[str] = None
+
+        for item in pending.values():
+            # Zustand kann sich seit dem Vormerken geändert haben
+            if not item.is_checked() or item.params.modus != "dateiname":
+                continue
+
+            is_valid, error_msg = self._validate_text_cached(item.params.text, item.params.modus, item.name)
+
+            if is_valid:
+                # Text ist gueltig -> Zeile zurücksetzen
+                self._highlight_row(item, error=False)
+                if 'text' in item.widgets:
+                    self._set_text_error_style(item, False)
+                continue
+
+            # Text ist zu lang -> ROT einfaerben
+            self._highlight_row(item, error=True)
+            if 'text' in item.widgets:
+                self._set_text_error_style(item, True)
+
+            # FIXED: Kategorie-Hervorhebung auch bei Dateiname-Modus (alle Ebenen im Pfad)
+            category_path = self._get_category_path_for_zeichen(item)
+            if category_path:
+                affected_categories |= self._get_all_category_levels(category_path)
+
+            if first_error is None:
+                first_error = error_msg
+
+        if affected_categories:
+            self._highlight_categories(affected_categories)
+
+        # Warnung NUR anzeigen wenn nicht bereits eine gezeigt wird
+        if first_error is not None and not self._batch_operation_active and not self._validation_warning_shown:
+            self._validation_warning_shown = True
+            self.validation_mgr.show_validation_warning(
+                self,
+                "Dateiname zu lang",
+                first_error + "\n\nDer Text wurde ROT markiert.\nBitte kürze den Text manuell!"
+            )
+            # FIXED: Flag mit Timer zurücksetzen (500ms Debounce)
+            self._reset_validation_warning_flag_delayed()
 
     def _on_text_changed(self, item: ZeichenTreeItem, text: str):
         """Text wurde geaendert"""
@@ -2778,30 +3118,14 @@ class MainWindow(QMainWindow):
 
         # VALIDATION: Prüfe ob Text in Canvas passt (nur bei Text-Modi)
         if text and item.params.modus in self.TEXT_MODES:  # FIXED: Alle Text-Modi validieren
-            # FIXED: font_size aus RuntimeConfig verwenden
-            from runtime_config import get_config
-            runtime_cfg = get_config()
-
-            is_valid, error_msg = self.validation_mgr.validate_text_length(
-                text=text,
-                modus=item.params.modus,
-                zeichen_hoehe_mm=self.settings.zeichen.zeichen_hoehe_mm,
-                zeichen_breite_mm=self.settings.zeichen.zeichen_breite_mm,
-                sicherheitsabstand_mm=self.settings.zeichen.sicherheitsabstand_mm,
-                font_size=runtime_cfg.font_size,  # FIXED: Aus RuntimeConfig statt DEFAULT_FONT_SIZE
-                item_name=item.name
-            )
+            is_valid, error_msg = self._validate_text_cached(text, item.params.modus, item.name)
 
             if not is_valid:
                 # FIXED: GANZE ZEILE rot hinterlegen (nicht nur Text-Widget)
                 self._highlight_row(item, error=True)
                 # FIXED: Textfeld ROT einfaerben mit Farb-Konstanten
                 if 'text' in item.widgets:
-                    item.widgets['text'].setStyleSheet(
-                        f"background-color: {VALIDATION_ERROR_BG}; "
-                        f"color: {VALIDATION_ERROR_FG}; "
-                        f"font-weight: bold;"
-                    )
+                    self._set_text_error_style(item, True)
                 # FIXED: Warnung nur wenn NICHT im Batch-Modus UND noch keine Warnung gezeigt
                 if not self._batch_operation_active and not self._validation_warning_shown:
                     self._validation_warning_shown = True
@@ -2816,21 +3140,21 @@ class MainWindow(QMainWindow):
                 self._highlight_row(item, error=False)
                 # FIXED: Text gueltig -> Normale Farbe
                 if 'text' in item.widgets:
-                    item.widgets['text'].setStyleSheet("")
+                    self._set_text_error_style(item, False)
         else:
             # FIXED: GANZE ZEILE zurücksetzen (nicht nur Text-Widget)
             self._highlight_row(item, error=False)
             # FIXED: Kein Text oder kein Text-Modus -> Normale Farbe
             if 'text' in item.widgets:
-                item.widgets['text'].setStyleSheet("")
+                self._set_text_error_style(item, False)
 
         item.params.text = text
         item.params.inherited = False
 
         # Propagieren
         if item.item_type != ZeichenTreeItem.TYPE_ZEICHEN:
-            item.propagate_params_to_children()
-            self._update_children_widgets(item)
+            # PERFORMANCE: Params + Widgets in einem Durchlauf
+            item.propagate_and_refresh_children(self._refresh_child_widgets)
 
     # v7.1: Grafik-Parameter Event-Handler entfernt (Grafik-Größe ist jetzt global)
 
@@ -2851,41 +3175,37 @@ class MainWindow(QMainWindow):
 
         # Bei "Nur Grafik" und "Schreiblinie" Textfeld deaktivieren
         # Bei "Dateiname" bleibt Textfeld aktiviert (manuell editierbar)
-        item.widgets['text'].setEnabled(modus not in ["ohne_text", "schreiblinie_staerke"])  # CHANGED: "nur_grafik" -> "ohne_text"
+        # PERFORMANCE: Nur bei Änderung setzen (setEnabled poliert den Style neu)
+        text_widget = item.widgets['text']
+        enabled = modus not in _DISABLED_TEXT_MODES  # CHANGED: "nur_grafik" -> "ohne_text"
+        if text_widget.isEnabled() != enabled:
+            text_widget.setEnabled(enabled)
 
     # v7.1: Grafik-Widget-Visibility-Methoden entfernt (keine per-Item-Widgets mehr)
 
-    def _update_children_widgets(self, parent_item: ZeichenTreeItem):
+    def _refresh_child_widgets(self, child: ZeichenTreeItem):
         """
-        Aktualisiert Widgets aller Kinder (nach Propagierung)
+        Überträgt Modus/Text-Parameter eines Items in seine Widgets (ohne Signale)
 
         Args:
-            parent_item: Parent-Item
+            child: Item (ohne Widgets: nichts zu tun, Params werden beim Erstellen übernommen)
         """
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            if isinstance(child, ZeichenTreeItem) and child.widgets:
-                # v7.1: Nur Modus und Text-Widgets (Grafik-Widgets entfernt)
-                child.widgets['modus'].blockSignals(True)
-                child.widgets['text'].blockSignals(True)
-
-                # Modus (Internal -> GUI aus modus_config.py)
-                gui_label = internal_to_gui(child.params.modus)
-                child.widgets['modus'].setCurrentText(gui_label)
+        if not child.widgets:
+            return
 
-                # Text-Platzhalter
-                self._update_text_placeholder(child, child.params.modus)
+        # v7.1: Nur Modus und Text-Widgets (Grafik-Widgets entfernt)
+        # FIXED: QSignalBlocker statt blockSignals-Paar (Signale auch bei Exception wieder frei)
+        modus_widget = child.widgets['modus']
+        text_widget = child.widgets['text']
+        with QSignalBlocker(modus_widget), QSignalBlocker(text_widget):
+            # Modus (PERFORMANCE: Index-Lookup statt Text-Suche)
+            modus_widget.setCurrentIndex(self._modus_to_index(child.params.modus))
 
-                # Text
-                child.widgets['text'].setText(child.params.text)
+            # Text-Platzhalter
+            self._update_text_placeholder(child, child.params.modus)
 
-                # Signale wieder aktivieren
-                child.widgets['modus'].blockSignals(False)
-                child.widgets['text'].blockSignals(False)
-
-                # Rekursiv
-                if child.item_type != ZeichenTreeItem.TYPE_ZEICHEN:
-                    self._update_children_widgets(child)
+            # Text
+            text_widget.setText(child.params.text)
 
     def _on_item_changed(self, item: QTreeWidgetItem, column: int):
         """Item wurde geändert (z.B. Checkbox)"""
@@ -2900,24 +3220,23 @@ class MainWindow(QMainWindow):
             checked = item.is_checked()
             self.logger.debug(f"_on_item_changed: Category {item.name} checkbox changed to {checked}")
 
-            # NEW: Wenn Checkbox aktiviert wird, propagiere ALLE Werte an Kinder
-            if checked and hasattr(item, '_was_unchecked'):
-                self._propagate_all_values_to_children(item)
-                delattr(item, '_was_unchecked')
-            elif not checked:
-                # Merken, dass es deaktiviert wurde
-                item._was_unchecked = True
-
             # FIXED: Batch-Modus aktivieren bevor Kinder aktiviert werden
             self._batch_operation_active = True
 
+            # PERFORMANCE: itemChanged einmal trennen + ein Repaint für die gesamte Kaskade
+            # (Validierung danach, da sie ggf. eine Warnung anzeigt)
             # EXPERIMENTAL: Disconnect itemChanged statt blockSignals()
             # blockSignals() auf TreeWidget löscht Selection - disconnect nur das Event
-            self.tree_zeichen.itemChanged.disconnect(self._on_item_changed)
-            try:
+            with self._tree_updates_paused():
+                # NEW: Wenn Checkbox aktiviert wird, propagiere ALLE Werte an Kinder
+                if checked and item._was_unchecked:
+                    self._propagate_all_values_to_children(item)
+                    item._was_unchecked = False
+                elif not checked:
+                    # Merken, dass es deaktiviert wurde
+                    item._was_unchecked = True
+
                 self._set_children_checked(item, checked)
-            finally:
-                self.tree_zeichen.itemChanged.connect(self._on_item_changed)
 
             # FIXED: Nach Aktivierung Batch-Validierung durchführen
             if checked:
@@ -2926,6 +3245,9 @@ class MainWindow(QMainWindow):
             # FIXED: Batch-Modus deaktivieren
             self._batch_operation_active = False
         else:
+            # PERFORMANCE: Checked-Zähler aktualisieren
+            self._update_checked_counts(item, item.is_checked())
+
             # Bei Zeichen: Kopien-SpinBox aktivieren/deaktivieren
             if 'kopien' in item.widgets:
                 item.widgets['kopien'].setEnabled(item.is_checked())
@@ -2940,7 +3262,8 @@ class MainWindow(QMainWindow):
                     # DEAKTIVIERT: Warnung zurücksetzen
                     self._reset_validation_highlight(item)
                     # FIXED: Auch Kategorien-Hervorhebung neu berechnen
-                    self._validate_all_text_lengths()
+                    # PERFORMANCE: Nur die Vorfahren statt kompletter Neuvalidierung
+                    self._revalidate_ancestors(item)
 
         # Statusbar aktualisieren
         self._update_statusbar()
@@ -2952,20 +3275,31 @@ class MainWindow(QMainWindow):
         EXPERIMENTAL: Signal wird vom Aufrufer disconnected, nicht hier
         """
         self.logger.debug(f"_set_children_checked: parent={parent_item.name}, checked={checked}")
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            if isinstance(child, ZeichenTreeItem):
+        # PERFORMANCE: Iterativ mit explizitem Stack statt Rekursion
+        stack = [parent_item]
+        while stack:
+            node = stack.pop()
+            for i in range(node.childCount()):
+                child = node.child(i)
+                if not isinstance(child, ZeichenTreeItem):
+                    continue
+
                 # Checkbox setzen (itemChanged Signal ist disconnected vom Aufrufer)
                 self.logger.debug(f"  Setting child checkbox: {child.name} -> {checked}")
                 child.set_checked(checked)
 
                 # Bei Zeichen: Kopien-SpinBox aktivieren/deaktivieren
-                if child.item_type == ZeichenTreeItem.TYPE_ZEICHEN and 'kopien' in child.widgets:
-                    child.widgets['kopien'].setEnabled(checked)
-
-                # Rekursiv
-                if child.item_type != ZeichenTreeItem.TYPE_ZEICHEN:
-                    self._set_children_checked(child, checked)
+                if child.item_type == ZeichenTreeItem.TYPE_ZEICHEN:
+                    # PERFORMANCE: Zähler pflegen (itemChanged ist hier disconnected)
+                    self._update_checked_counts(child, checked)
+                    if 'kopien' in child.widgets:
+                        # PERFORMANCE: Nur bei Änderung setzen (kein unnötiges Repolish)
+                        kopien_widget = child.widgets['kopien']
+                        if kopien_widget.isEnabled() != checked:
+                            kopien_widget.setEnabled(checked)
+                else:
+                    # Unterkategorie später abarbeiten
+                    stack.append(child)
 
     def _propagate_kopien_to_children(self, parent_item: ZeichenTreeItem, anzahl: int):
         """
@@ -2976,19 +3310,27 @@ class MainWindow(QMainWindow):
             anzahl: Kopien-Anzahl
         """
         # NEW: Propagiere Kopien-Anzahl an alle Kinder
-        for i in range(parent_item.childCount()):
-            child = parent_item.child(i)
-            if isinstance(child, ZeichenTreeItem):
+        # PERFORMANCE: Iterativ mit explizitem Stack statt Rekursion
+        stack = [parent_item]
+        while stack:
+            node = stack.pop()
+            for i in range(node.childCount()):
+                child = node.child(i)
+                if not isinstance(child, ZeichenTreeItem):
+                    continue
+
                 child.anzahl_kopien = anzahl
                 if 'kopien' in child.widgets:
                     # FIXED: Signale blockieren um valueChanged-Kaskade zu verhindern
-                    child.widgets['kopien'].blockSignals(True)
-                    child.widgets['kopien'].setValue(anzahl)
-                    child.widgets['kopien'].blockSignals(False)
+                    kopien_widget = child.widgets['kopien']
+                    # PERFORMANCE: Nur bei Änderung setzen
+                    if kopien_widget.value() != anzahl:
+                        with QSignalBlocker(kopien_widget):
+                            kopien_widget.setValue(anzahl)
 
-                # Rekursiv
+                # Unterkategorien später abarbeiten
                 if child.item_type != ZeichenTreeItem.TYPE_ZEICHEN:
-                    self._propagate_kopien_to_children(child, anzahl)
+                    stack.append(child)
 
     def _propagate_all_values_to_children(self, parent_item: ZeichenTreeItem):
         """
@@ -3000,22 +3342,18 @@ class MainWindow(QMainWindow):
         # NEW: Überschreibe alle Werte der Kinder mit den Werten des Parents
         self.logger.info(f"Propagiere alle Werte von {parent_item.name} an Kinder")
 
-        # Parameter propagieren
-        parent_item.propagate_params_to_children()
+        # PERFORMANCE: Keine Zwischen-Repaints/itemChanged pro Kind
+        with self._tree_updates_paused():
+            # Parameter propagieren + Widgets aktualisieren (PERFORMANCE: ein Durchlauf)
+            parent_item.propagate_and_refresh_children(self._refresh_child_widgets)
 
-        # Kopien propagieren
-        if 'kopien' in parent_item.widgets:
-            anzahl = parent_item.widgets['kopien'].value()
-            self._propagate_kopien_to_children(parent_item, anzahl)
-
-        # Widgets aktualisieren
-        self._update_children_widgets(parent_item)
+            # Kopien propagieren
+            if 'kopien' in parent_item.widgets:
+                anzahl = parent_item.widgets['kopien'].value()
+                self._propagate_kopien_to_children(parent_item, anzahl)
 
     def _on_vorlagen_ordner_explorer_oeffnen(self):
         """Öffnet Vorlagen-Ordner im Dateimanager"""
-        import subprocess
-        from pathlib import Path
-
         vorlagen_ordner = Path(self.settings.zeichen_ordner)
 
         if not vorlagen_ordner.exists():
@@ -3042,8 +3380,11 @@ class MainWindow(QMainWindow):
                 return
 
         try:
-            # Dateimanager öffnen
-            subprocess.run([filemanager(), str(vorlagen_ordner)])
+            # PERFORMANCE: Plattform-nativ über Qt öffnen (kein Prozessstart),
+            # externer Dateimanager nur als Fallback
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(vorlagen_ordner))):
+                self.logger.warning("QDesktopServices konnte Vorlagen-Ordner nicht öffnen - nutze Dateimanager")
+                subprocess.run([filemanager(), str(vorlagen_ordner)])
             self.logger.info(f"Vorlagen-Ordner geöffnet: {vorlagen_ordner}")
         except Exception as e:
             self.logger.error(f"Fehler beim Öffnen des Vorlagen-Ordners: {e}")
@@ -3086,9 +3427,19 @@ class MainWindow(QMainWindow):
         self.logger.info(f"Aktives Layout für Export: {active_layout.upper()}")
 
         # NEW: Export-Dialog öffnen
+        # NOTE: Bewusst lokaler Import - export_dialog lädt Wand/ImageMagick, das Programm
+        # muss auch ohne ImageMagick starten (Warnung in main.py). Nach dem ersten Import
+        # liefert sys.modules das Modul ohne erneuten Ladevorgang.
         from gui.dialogs.export_dialog import ExportDialog
 
-        dialog = ExportDialog(checked_zeichen, self.settings, active_layout, self)
+        # PERFORMANCE: Dialog einmal erstellen und wiederverwenden (reset() statt Neuaufbau).
+        # Läuft noch ein Export aus einem geschlossenen Dialog, bekommt dieser einen neuen.
+        dialog = self._export_dialog
+        if dialog is None or dialog.is_export_running():
+            dialog = ExportDialog(checked_zeichen, self.settings, active_layout, self)
+            self._export_dialog = dialog
+        else:
+            dialog.reset(checked_zeichen, self.settings, active_layout)
         result = dialog.exec()
 
         if result == QDialog.DialogCode.Accepted:
@@ -3102,16 +3453,13 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(2000, self._update_statusbar)
 
     def _get_all_checked_zeichen(self) ->list[ZeichenTreeItem]:
-        """Sammelt alle angehakten Zeichen"""
-        checked = []
-
-        # Alle Top-Level Items durchgehen
-        for i in range(self.tree_zeichen.topLevelItemCount()):
-            item = self.tree_zeichen.topLevelItem(i)
-            if isinstance(item, ZeichenTreeItem):
-                checked.extend(item.get_checked_zeichen())
+        """
+        Sammelt alle angehakten Zeichen
 
-        return checked
+        PERFORMANCE: Aus der inkrementell gepflegten Menge _checked_zeichen (O(k) statt
+        Tree-Durchlauf), sortiert nach _tree_index für die gewohnte Tree-Reihenfolge.
+        """
+        return sorted(self._checked_zeichen.values(), key=_TREE_INDEX_KEY)
 
     def _on_einstellungen(self):
         """
@@ -3119,9 +3467,13 @@ class MainWindow(QMainWindow):
 
         NEW (v7.3): Settings Dialog implementiert
         """
-        from gui.dialogs.settings_dialog import SettingsDialog
-
-        dialog = SettingsDialog(self.settings_mgr, self)
+        # PERFORMANCE: Dialog einmal erstellen und wiederverwenden (reset() statt Neuaufbau)
+        dialog = self._settings_dialog
+        if dialog is None:
+            dialog = SettingsDialog(self.settings_mgr, self)
+            self._settings_dialog = dialog
+        else:
+            dialog.reset()
         result = dialog.exec()
 
         if result == QDialog.DialogCode.Accepted:
@@ -3130,17 +3482,15 @@ class MainWindow(QMainWindow):
             self.logger.info("Einstellungen wurden aktualisiert")
 
             # RuntimeConfig aktualisieren
-            from runtime_config import RuntimeConfig
-            RuntimeConfig.get_instance().reload_from_settings()
+            self._runtime_cfg = get_config()
+            self._runtime_cfg.reload_from_settings()
+
+            # Schriftart kann sich geändert haben -> S1-Info-Labels neu berechnen
+            self._schedule_s1_update()
 
     def _on_benutzerhandbuch(self):
         """Oeffnet Benutzerhandbuch (PDF bevorzugt, sonst Markdown)"""
-        import subprocess
-        import platform
-        from pathlib import Path
-
         # Basis-Verzeichnis ermitteln
-        import sys
         if getattr(sys, 'frozen', False):
             base_dir = Path(sys.executable).parent
         else:
@@ -3153,23 +3503,26 @@ class MainWindow(QMainWindow):
         # Versuche PDF zu öffnen (bevorzugt)
         if pdf_path.exists():
             try:
-                system = platform.system()
-                if system == 'Windows':
-                    # Windows: Standard-PDF-Reader (primär unterstützt)
-                    subprocess.run(['start', '', str(pdf_path)], shell=True)
-                elif system == 'Linux':
-                    # Linux: xdg-open (Experimentell - wird getestet)
-                    subprocess.run(['xdg-open', str(pdf_path)])
-                else:
-                    # Nicht unterstütztes System (z.B. macOS)
-                    self.logger.warning(f"Nicht unterstütztes Betriebssystem: {system}")
-                    QMessageBox.warning(
-                        self,
-                        "Nicht unterstützt",
-                        f"Das Öffnen von Dateien wird auf {system} nicht unterstützt.\n\n"
-                        f"Bitte öffne die Datei manuell:\n{pdf_path}"
-                    )
-                    return
+                # PERFORMANCE: Standardprogramm direkt über Qt öffnen (keine cmd.exe-Shell),
+                # plattformspezifischer Aufruf nur als Fallback
+                if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(pdf_path))):
+                    system = platform.system()
+                    if system == 'Windows':
+                        # Windows: Standard-PDF-Reader (primär unterstützt, ShellExecute ohne Shell)
+                        os.startfile(str(pdf_path))
+                    elif system == 'Linux':
+                        # Linux: xdg-open (Experimentell - wird getestet)
+                        subprocess.Popen(['xdg-open', str(pdf_path)])
+                    else:
+                        # Nicht unterstütztes System (z.B. macOS)
+                        self.logger.warning(f"Nicht unterstütztes Betriebssystem: {system}")
+                        QMessageBox.warning(
+                            self,
+                            "Nicht unterstützt",
+                            f"Das Öffnen von Dateien wird auf {system} nicht unterstützt.\n\n"
+                            f"Bitte öffne die Datei manuell:\n{pdf_path}"
+                        )
+                        return
 
                 self.logger.info(f"Benutzerhandbuch geöffnet: {pdf_path}")
                 return
@@ -3180,23 +3533,26 @@ class MainWindow(QMainWindow):
         # Fallback: Markdown im Browser öffnen
         if md_path.exists():
             try:
-                system = platform.system()
-                if system == 'Windows':
-                    # Windows: Standard-Browser (primär unterstützt)
-                    subprocess.run(['start', '', str(md_path)], shell=True)
-                elif system == 'Linux':
-                    # Linux: xdg-open (Experimentell - wird getestet)
-                    subprocess.run(['xdg-open', str(md_path)])
-                else:
-                    # Nicht unterstütztes System (z.B. macOS)
-                    self.logger.warning(f"Nicht unterstütztes Betriebssystem: {system}")
-                    QMessageBox.warning(
-                        self,
-                        "Nicht unterstützt",
-                        f"Das Öffnen von Dateien wird auf {system} nicht unterstützt.\n\n"
-                        f"Bitte öffne die Datei manuell:\n{md_path}"
-                    )
-                    return
+                # PERFORMANCE: Standardprogramm direkt über Qt öffnen (keine cmd.exe-Shell),
+                # plattformspezifischer Aufruf nur als Fallback
+                if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(md_path))):
+                    system = platform.system()
+                    if system == 'Windows':
+                        # Windows: Standard-Browser (primär unterstützt, ShellExecute ohne Shell)
+                        os.startfile(str(md_path))
+                    elif system == 'Linux':
+                        # Linux: xdg-open (Experimentell - wird getestet)
+                        subprocess.Popen(['xdg-open', str(md_path)])
+                    else:
+                        # Nicht unterstütztes System (z.B. macOS)
+                        self.logger.warning(f"Nicht unterstütztes Betriebssystem: {system}")
+                        QMessageBox.warning(
+                            self,
+                            "Nicht unterstützt",
+                            f"Das Öffnen von Dateien wird auf {system} nicht unterstützt.\n\n"
+                            f"Bitte öffne die Datei manuell:\n{md_path}"
+                        )
+                        return
 
                 self.logger.info(f"Benutzerhandbuch geöffnet: {md_path}")
                 return
@@ -3217,9 +3573,6 @@ class MainWindow(QMainWindow):
     def _on_logs_oeffnen(self):
         """Oeffnet Log-Ordner im Dateimanager"""
         # NEW: Log-Ordner im Dateimanager öffnen
-        import subprocess
-        from constants import LOGS_DIR
-
         if not LOGS_DIR.exists():
             QMessageBox.warning(
                 self,
@@ -3248,15 +3601,21 @@ class MainWindow(QMainWindow):
         about_box.setTextFormat(Qt.TextFormat.RichText)
 
         # Logo setzen (falls vorhanden)
-        if LOGO_PATH.exists():
+        # PERFORMANCE: Skaliertes Logo aus QPixmapCache (PNG-Dekodierung + Skalierung nur einmal)
+        logo_pixmap = QPixmapCache.find(ABOUT_LOGO_CACHE_KEY)
+        if logo_pixmap is None and LOGO_PATH.exists():
             logo_pixmap = QPixmap(str(LOGO_PATH))
-            if not logo_pixmap.isNull():
-                # Logo auf 128px Hoehe skalieren
+            if logo_pixmap.isNull():
+                logo_pixmap = None
+            else:
+                # Logo auf ABOUT_LOGO_HEIGHT_PX Hoehe skalieren
                 logo_pixmap = logo_pixmap.scaledToHeight(
-                    128,
+                    ABOUT_LOGO_HEIGHT_PX,
                     Qt.TransformationMode.SmoothTransformation
                 )
-                about_box.setIconPixmap(logo_pixmap)
+                QPixmapCache.insert(ABOUT_LOGO_CACHE_KEY, logo_pixmap)
+        if logo_pixmap is not None:
+            about_box.setIconPixmap(logo_pixmap)
 
         # Text setzen
         about_box.setText(
@@ -3285,21 +3644,35 @@ class MainWindow(QMainWindow):
 
     def _on_search_text_changed(self, search_text: str):
         """
-        Filtert Tree-Items basierend auf Suchtext
+        Suchtext wurde geändert - Filter entprellt anstoßen
+
+        PERFORMANCE: Jede Taste startet den Timer neu, gefiltert wird einmal
+        in _apply_search_filter() nach SEARCH_DEBOUNCE_MS ohne Eingabe.
 
         Args:
             search_text: Suchtext vom Benutzer
         """
-        search_text = search_text.strip().lower()
+        self._search_timer.start()
 
-        # Wenn Suchfeld leer: Alle Items anzeigen
-        if not search_text:
-            self._show_all_items()
-            return
+    def _apply_search_filter(self):
+        """Filtert Tree-Items basierend auf dem aktuellen Suchtext"""
+        search_text = self.line_search.text().strip().lower()
 
-        # Alle Items durchsuchen und filtern
-        root = self.tree_zeichen.invisibleRootItem()
-        self._filter_tree_items(root, search_text)
+        # PERFORMANCE: Verfeinerung des letzten Suchtexts (Präfix) - bereits versteckte
+        # Items können nicht wieder passen und werden übersprungen
+        refining = bool(self._last_search) and search_text.startswith(self._last_search)
+        self._last_search = search_text
+
+        # PERFORMANCE: Ein Repaint für den gesamten Filter-Durchlauf
+        with self._tree_updates_paused():
+            # Wenn Suchfeld leer: Alle Items anzeigen
+            if not search_text:
+                self._show_all_items()
+                return
+
+            # Alle Items durchsuchen und filtern
+            root = self.tree_zeichen.invisibleRootItem()
+            self._filter_tree_items(root, search_text, refining)
 
     def _show_all_items(self):
         """Zeigt alle Tree-Items an"""
@@ -3316,12 +3689,11 @@ class MainWindow(QMainWindow):
         """
         for i in range(item.childCount()):
             child = item.child(i)
-            # Verwende setRowHidden() für bessere Widget-Behandlung
-            index = self.tree_zeichen.indexFromItem(child)
-            self.tree_zeichen.setRowHidden(index.row(), index.parent(), not visible)
+            # PERFORMANCE: setHidden() direkt (Qt setzt intern setRowHidden, ohne indexFromItem in Python)
+            child.setHidden(not visible)
             self._set_item_visibility_recursive(child, visible)
 
-    def _filter_tree_items(self, parent_item: QTreeWidgetItem, search_text: str) -> bool:
+    def _filter_tree_items(self, parent_item: QTreeWidgetItem, search_text: str, refining: bool = False) -> bool:
         """
         Filtert Tree-Items rekursiv basierend auf Suchtext
 
@@ -3332,6 +3704,8 @@ class MainWindow(QMainWindow):
         Args:
             parent_item: Eltern-Item
             search_text: Suchtext (lowercase)
+            refining: True wenn search_text den vorherigen Suchtext verlängert
+                      (versteckte Teilbäume werden dann übersprungen)
 
         Returns:
             True wenn dieses Item oder ein Kind den Suchtext enthält
@@ -3342,19 +3716,22 @@ class MainWindow(QMainWindow):
         for i in range(parent_item.childCount()):
             child = parent_item.child(i)
 
+            # PERFORMANCE: Bei Verfeinerung bleibt Verstecktes versteckt
+            if refining and child.isHidden():
+                continue
+
             # Rekursiv Kinder filtern
-            child_matches = self._filter_tree_items(child, search_text)
+            child_matches = self._filter_tree_items(child, search_text, refining)
 
-            # Prüfen ob der Name des Items den Suchtext enthält
-            item_name = child.text(ZeichenTreeItem.COL_NAME).lower()
+            # Prüfen ob der Name des Items den Suchtext enthält (PERFORMANCE: vorberechnet)
+            item_name = getattr(child, '_name_lower', None) or child.text(ZeichenTreeItem.COL_NAME).lower()
             name_matches = search_text in item_name
 
             # Item anzeigen wenn Name matched ODER ein Kind matched
             should_show = name_matches or child_matches
 
-            # Verwende setRowHidden() statt setHidden() für bessere Widget-Behandlung
-            index = self.tree_zeichen.indexFromItem(child)
-            self.tree_zeichen.setRowHidden(index.row(), index.parent(), not should_show)
+            # PERFORMANCE: setHidden() direkt (Qt setzt intern setRowHidden, ohne indexFromItem in Python)
+            child.setHidden(not should_show)
 
             # Parent soll angezeigt werden wenn mindestens ein Kind sichtbar ist
             if should_show:
@@ -3425,43 +3802,80 @@ class MainWindow(QMainWindow):
 
             self.logger.debug("S2 Aspect-Lock deaktiviert: Breite manuell änderbar")
 
-    def _on_s1_links_prozent_changed(self):
+    def _schedule_s1_update(self):
         """
-        Links-Prozent wurde geändert (S1-Layout)
+        Plant die Aktualisierung der S1-Info-Labels (Links-Prozent, Schreiblinien, Größen)
 
-        Aktualisiert automatisch Rechts-Prozent Label
+        PERFORMANCE: Mehrere valueChanged-Signale kurz hintereinander (Scrollen,
+        gehaltene Pfeiltaste, Aspect-Lock setzt Breite mit) werden zu EINEM
+        Durchlauf im nächsten Event-Loop-Zyklus zusammengefasst.
         """
-        self._update_s1_rechts_prozent()
+        if self._s1_update_pending:
+            return
+        self._s1_update_pending = True
+        QTimer.singleShot(0, self._flush_s1_update)
+
+    def _flush_s1_update(self):
+        """Führt die gebündelte Aktualisierung der S1-Info-Labels aus"""
+        self._s1_update_pending = False
+
+        # PERFORMANCE: Gemeinsame Abmessungen nur einmal auslesen (ein SIP-Aufruf pro SpinBox)
+        # und an alle drei Berechnungen weiterreichen
+        hoehe = self.spin_s1_zeichen_hoehe.value()
 
-    def _on_s1_anzahl_schreiblinien_changed(self):
+        # FIXED: Wenn Aspect-Lock aktiviert, Breite berechnen
+        if self.check_s1_aspect_locked.isChecked():
+            breite = hoehe * 2.0
+        else:
+            breite = self.spin_s1_zeichen_breite.value()
+
+        abstand = self.spin_s1_abstand_rand.value()
+        links_prozent = self.spin_s1_links_prozent.value()
+
+        # Qt fasst die update()-Aufrufe der geänderten Labels zu einem Paint-Event zusammen,
+        # unveränderte Labels (_set_label_text) lösen gar kein Repaint aus
+        self._update_s1_rechts_prozent(hoehe, breite, abstand, links_prozent)
+        self._update_s1_line_metrics(hoehe, abstand)
+        self._update_s1_max_grafik_labels(hoehe, breite, abstand, links_prozent)
+
+    def _set_label_text(self, label: QLabel, text: str):
         """
-        Anzahl Schreiblinien wurde geändert (S1-Layout)
+        Setzt Label-Text nur bei Änderung (PERFORMANCE: kein unnötiges Relayout)
 
-        Aktualisiert automatisch Zeilenhöhe und Schriftgröße
+        Nach der .1f-Rundung ergeben viele aufeinanderfolgende SpinBox-Werte denselben
+        Text; der zuletzt gesetzte Text wird in Python gemerkt (kein label.text()-Aufruf).
+
+        Args:
+            label: Ziel-Label
+            text: Neuer Text
         """
-        self._update_s1_line_metrics()
+        key = id(label)
+        if self._label_texts.get(key) != text:
+            label.setText(text)
+            self._label_texts[key] = text
 
-    def _update_s1_rechts_prozent(self):
+    def _update_s1_rechts_prozent(self, hoehe: float, breite: float, abstand: float, links_prozent: int):
         """
         Berechnet und aktualisiert Rechts-Prozent Label (S1-Layout)
 
         Formel: Rechts-Prozent = 100 - Links-Prozent
         CHANGED: Zeigt auch mm-Wert an (fuer beide Seiten)
-        """
-        links_prozent = self.spin_s1_links_prozent.value()
-        rechts_prozent = 100 - links_prozent
 
-        # CHANGED: Berechne mm-Werte fuer beide Seiten (NACH Sicherheitsabstand!)
-        hoehe = self.spin_s1_zeichen_hoehe.value()
-
-        # FIXED: Wenn Aspect-Lock aktiviert, Breite berechnen
-        if self.check_s1_aspect_locked.isChecked():
-            breite = hoehe * 2.0
-        else:
-            breite = self.spin_s1_zeichen_breite.value()
+        Args:
+            hoehe: Zeichenhöhe in mm
+            breite: Zeichenbreite in mm (bei Aspect-Lock bereits berechnet)
+            abstand: Sicherheitsabstand in mm
+            links_prozent: Aufteilung Links in Prozent
+        """
+        # PERFORMANCE: Unveränderte Eingaben -> Labels sind bereits aktuell
+        key = (hoehe, breite, abstand, links_prozent)
+        if self._s1_metrics_cache.get('rechts_prozent') == key:
+            return
+        self._s1_metrics_cache['rechts_prozent'] = key
 
-        abstand = self.spin_s1_abstand_rand.value()
+        rechts_prozent = 100 - links_prozent
 
+        # CHANGED: Berechne mm-Werte fuer beide Seiten (NACH Sicherheitsabstand!)
         # Verfuegbare Breite nach Sicherheitsabstand
         verfuegbar_breite = breite - 2 * abstand  # z.B. 90 - 6 = 84mm
 
@@ -3470,35 +3884,70 @@ class MainWindow(QMainWindow):
         rechts_breite_mm = verfuegbar_breite * (rechts_prozent / 100.0)  # z.B. 84 * 0.5 = 42mm
 
         # NEW: Linke Breite in mm anzeigen
-        if hasattr(self, 'label_s1_links_breite_mm'):
-            self.label_s1_links_breite_mm.setText(f"= {links_breite_mm:.1f} mm")
+        if self._has_s1_links_breite_label:
+            self._set_label_text(self.label_s1_links_breite_mm, f"= {links_breite_mm:.1f} mm")
 
         # Label aktualisieren mit Prozent und mm
-        self.label_s1_rechts_prozent_value.setText(f"{rechts_prozent}% = {rechts_breite_mm:.1f} mm")
+        self._set_label_text(self.label_s1_rechts_prozent_value, f"{rechts_prozent}% = {rechts_breite_mm:.1f} mm")
 
-        self.logger.debug(f"S1 Aufteilung: Links {links_prozent}% ({links_breite_mm:.1f}mm) | Rechts {rechts_prozent}% ({rechts_breite_mm:.1f}mm)")
+        # PERFORMANCE: %-Formatierung erst wenn DEBUG aktiv ist (Logging formatiert lazy)
+        self.logger.debug(
+            "S1 Aufteilung: Links %d%% (%.1fmm) | Rechts %d%% (%.1fmm)",
+            links_prozent, links_breite_mm, rechts_prozent, rechts_breite_mm
+        )
 
-    def _update_s1_max_grafik_labels(self):
+    def _font_ascent_descent_ratio(self, font_family: str) -> tuple[float, float]:
+        """
+        Liefert Ascent/Descent einer Schriftart als Anteil der Schriftgröße
+
+        PERFORMANCE: Einmal pro Schriftart über QFontMetricsF ermittelt und gecacht
+        (Verhältnisse sind unabhängig von Schriftgröße und DPI).
+
+        Args:
+            font_family: Name der Schriftart
+
+        Returns:
+            (ascent_ratio, descent_ratio) - Fallback FONT_ASCENT_RATIO/FONT_DESCENT_RATIO
+        """
+        ratios = self._fm_cache.get(font_family)
+        if ratios is None:
+            font = QFont(font_family)
+            font.setPixelSize(FONT_METRICS_REF_PX)
+            fm = QFontMetricsF(font)
+            ascent, descent = fm.ascent(), fm.descent()
+            if ascent > 0:
+                ratios = (ascent / FONT_METRICS_REF_PX, descent / FONT_METRICS_REF_PX)
+            else:
+                ratios = (FONT_ASCENT_RATIO, FONT_DESCENT_RATIO)
+            self._fm_cache[font_family] = ratios
+        return ratios
+
+    def _update_s1_max_grafik_labels(self, hoehe: float, breite: float, abstand: float, links_prozent: int):
         """
         Berechnet und aktualisiert die Labels für maximale Grafikabmessungen (S1-Layout)
 
         Zeigt an:
         - Text-Modi: Max. Grafik bei 1 Textzeile
         - Nur-Grafik: Max. Grafik bei vollem Platz
-        """
-        from constants import LINE_HEIGHT_FACTOR, POINTS_PER_INCH, mm_to_pixels, pixels_to_mm
-
-        # Aktuelle Werte holen
-        hoehe = self.spin_s1_zeichen_hoehe.value()
 
-        # FIXED: Wenn Aspect-Lock aktiviert, Breite berechnen
-        if self.check_s1_aspect_locked.isChecked():
-            breite = hoehe * 2.0
-        else:
-            breite = self.spin_s1_zeichen_breite.value()
+        Args:
+            hoehe: Zeichenhöhe in mm
+            breite: Zeichenbreite in mm (bei Aspect-Lock bereits berechnet)
+            abstand: Sicherheitsabstand in mm
+            links_prozent: Aufteilung Links in Prozent
+        """
+        # Text-Parameter holen (je ein SIP-Aufruf, vor jeder Berechnung)
+        font_size = self.spin_s1_font_size.value()
+        text_bottom_offset_mm = self.spin_s1_text_bottom_offset.value()
+        abstand_grafik_text_mm = self.spin_s1_abstand_grafik_text.value()
+        font_family = self._runtime_cfg.font_family
 
-        abstand = self.spin_s1_abstand_rand.value()
-        links_prozent = self.spin_s1_links_prozent.value()
+        # PERFORMANCE: Unveränderte Eingaben -> Labels sind bereits aktuell
+        key = (hoehe, breite, abstand, links_prozent,
+               font_size, text_bottom_offset_mm, abstand_grafik_text_mm, font_family)
+        if self._s1_metrics_cache.get('max_grafik') == key:
+            return
+        self._s1_metrics_cache['max_grafik'] = key
 
         # Verfügbarer Bereich nach Sicherheitsabstand
         verfuegbar_hoehe = hoehe - 2 * abstand
@@ -3507,23 +3956,10 @@ class MainWindow(QMainWindow):
         # Linke Breite (für Grafik)
         linke_breite_mm = verfuegbar_breite * (links_prozent / 100.0)
 
-        # Text-Höhe für 1 Zeile berechnen (S1-Layout)
-        font_size = self.spin_s1_font_size.value()
-        dpi = 300  # Standard-DPI für Berechnung
-        font_size_px = int((font_size / POINTS_PER_INCH) * dpi)
-
-        # Maximale Font-Metrics (vereinfachte Berechnung)
-        max_ascent = int(font_size_px * 0.8)  # Näherungswert
-        max_descent = int(font_size_px * 0.2)  # Näherungswert
-        text_bottom_offset_mm = self.spin_s1_text_bottom_offset.value()
-        bottom_offset_px = mm_to_pixels(text_bottom_offset_mm, dpi)
-
-        # Text-Höhe für 1 Zeile (S1-Layout)
-        text_height_px = max_ascent + max_descent + bottom_offset_px
-        text_height_mm = pixels_to_mm(text_height_px, dpi)
-
-        # Abstand Grafik-Text
-        abstand_grafik_text_mm = self.spin_s1_abstand_grafik_text.value()
+        # Text-Höhe für 1 Zeile (S1-Layout): Ascent + Descent der Schriftart + Abstand unten
+        # PERFORMANCE: Direkt in mm statt Umweg über Pixel bei fester DPI (DPI kürzt sich heraus)
+        ascent_ratio, descent_ratio = self._font_ascent_descent_ratio(font_family)
+        text_height_mm = font_size * _MM_PER_PT * (ascent_ratio + descent_ratio) + text_bottom_offset_mm
 
         # Text-Modi: Verfügbare Höhe - Texthöhe - Abstand
         max_grafik_text_hoehe = verfuegbar_hoehe - text_height_mm - abstand_grafik_text_mm
@@ -3534,22 +3970,23 @@ class MainWindow(QMainWindow):
         max_grafik_nur_breite = linke_breite_mm
 
         # Labels aktualisieren
-        if hasattr(self, 'label_s1_max_grafik_text_modi'):
-            self.label_s1_max_grafik_text_modi.setText(
+        if self._has_s1_grafik_labels:
+            self._set_label_text(
+                self.label_s1_max_grafik_text_modi,
                 f"Text-Modi: Max. {max_grafik_text_hoehe:.1f} x {max_grafik_text_breite:.1f} mm"
             )
-
-        if hasattr(self, 'label_s1_max_grafik_nur_grafik'):
-            self.label_s1_max_grafik_nur_grafik.setText(
+            self._set_label_text(
+                self.label_s1_max_grafik_nur_grafik,
                 f"Nur-Grafik: Max. {max_grafik_nur_hoehe:.1f} x {max_grafik_nur_breite:.1f} mm"
             )
 
+        # PERFORMANCE: %-Formatierung erst wenn DEBUG aktiv ist (Logging formatiert lazy)
         self.logger.debug(
-            f"S1 Max-Grafik: Text-Modi {max_grafik_text_hoehe:.1f}x{max_grafik_text_breite:.1f}mm, "
-            f"Nur-Grafik {max_grafik_nur_hoehe:.1f}x{max_grafik_nur_breite:.1f}mm"
+            "S1 Max-Grafik: Text-Modi %.1fx%.1fmm, Nur-Grafik %.1fx%.1fmm",
+            max_grafik_text_hoehe, max_grafik_text_breite, max_grafik_nur_hoehe, max_grafik_nur_breite
         )
 
-    def _update_s1_line_metrics(self):
+    def _update_s1_line_metrics(self, zeichen_hoehe: float, sicherheitsabstand: float):
         """
         Berechnet und aktualisiert Zeilenhöhe + Schriftgröße (S1-Layout)
 
@@ -3559,15 +3996,20 @@ class MainWindow(QMainWindow):
         - Zeilenhöhe (mm) = verfügbare_höhe / anzahl_zeilen
         - Schriftgröße (mm) = Zeilenhöhe / LINE_HEIGHT_FACTOR
         - Schriftgröße (pt) = (font_size_mm * 72) / 25.4
-        """
-        from constants import LINE_HEIGHT_FACTOR, SYSTEM_POINTS_PER_INCH
 
+        Args:
+            zeichen_hoehe: Zeichenhöhe in mm
+            sicherheitsabstand: Sicherheitsabstand in mm
+        """
         # Anzahl Schreiblinien (INPUT vom User)
         anzahl_zeilen = self.spin_s1_anzahl_schreiblinien.value()
 
-        # Verfügbare Höhe für Schreiblinien (Zeichenhöhe - 2 x Sicherheitsabstand)
-        zeichen_hoehe = self.spin_s1_zeichen_hoehe.value()
-        sicherheitsabstand = self.spin_s1_abstand_rand.value()
+        # PERFORMANCE: Unveränderte Eingaben -> Labels sind bereits aktuell
+        key = (anzahl_zeilen, zeichen_hoehe, sicherheitsabstand)
+        if self._s1_metrics_cache.get('line_metrics') == key:
+            return
+        self._s1_metrics_cache['line_metrics'] = key
+
         verfuegbare_hoehe_mm = zeichen_hoehe - (2 * sicherheitsabstand)
 
         # Zeilenhöhe berechnen (verfügbare Höhe / Anzahl Zeilen)
@@ -3578,15 +4020,16 @@ class MainWindow(QMainWindow):
 
         # Schriftgröße in Punkten berechnen (mm -> pt)
         # 1 pt = 1/72 inch, 1 inch = 25.4 mm
-        font_size_pt = (font_size_mm * SYSTEM_POINTS_PER_INCH) / 25.4
+        font_size_pt = font_size_mm * _PT_PER_MM
 
         # Labels aktualisieren
-        self.label_s1_zeilenhoehe.setText(f"-> Zeilenhöhe: {line_height_mm:.1f} mm")
-        self.label_s1_schriftgroesse.setText(f"Schriftgröße: {font_size_pt:.1f} pt")
+        self._set_label_text(self.label_s1_zeilenhoehe, f"-> Zeilenhöhe: {line_height_mm:.1f} mm")
+        self._set_label_text(self.label_s1_schriftgroesse, f"Schriftgröße: {font_size_pt:.1f} pt")
 
+        # PERFORMANCE: %-Formatierung erst wenn DEBUG aktiv ist (Logging formatiert lazy)
         self.logger.debug(
-            f"S1 Schreiblinien: {anzahl_zeilen} Zeilen -> {line_height_mm:.1f}mm/Zeile, "
-            f"{font_size_pt:.1f}pt bei {verfuegbare_hoehe_mm:.1f}mm Höhe"
+            "S1 Schreiblinien: %d Zeilen -> %.1fmm/Zeile, %.1fpt bei %.1fmm Höhe",
+            anzahl_zeilen, line_height_mm, font_size_pt, verfuegbare_hoehe_mm
         )
 
 
@@ -12,7 +12,7 @@ Unterstuetzt:
 """
 
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List
 from dataclasses import dataclass, field
 
 from PyQt6.QtWidgets import QTreeWidgetItem
@@ -91,18 +91,45 @@ class ZeichenTreeItem(QTreeWidgetItem):
         self.name = name
         self.svg_path = svg_path
 
+        # PERFORMANCE: Kleingeschriebener Name für die Suche (kein lower() pro Tastendruck)
+        self._name_lower: str = name.lower()
+
         # Parameter (mit Defaults)
         self.params = ZeichenParameter()
 
         # Vorschaubild (wird spaeter geladen)
         self.preview_pixmap: Optional[QPixmap] = None
 
-        # Widgets (werden spaeter gesetzt)
+        # Widgets (werden spaeter gesetzt, PERFORMANCE: lazy beim Aufklappen)
         self.widgets = {}
+        self._widgets_built: bool = False
 
         # Anzahl Kopien (Standard: 1)
         self.anzahl_kopien: int = 1
 
+        # PERFORMANCE: Zähler für angehakte Zeichen im Teilbaum (nur Kategorien relevant)
+        # und ob dieses Zeichen bereits als angehakt gezählt wurde (nur Zeichen relevant).
+        # Werden vom MainWindow gepflegt (_update_checked_counts)
+        self._checked_descendant_count: int = 0
+        self._counted_as_checked: bool = False
+
+        # PERFORMANCE: Kategorie-Pfad (beim Tree-Aufbau gesetzt)
+        # Kategorien: eigener Pfad inkl. Name, Zeichen: Pfad der Parent-Kategorie
+        self._category_path: tuple[str, ...] = ()
+
+        # PERFORMANCE: Position in der flachen Zeichen-Liste (Tree-Reihenfolge, nur Zeichen),
+        # Sortier-Key für angehakte Zeichen (MainWindow._get_all_checked_zeichen)
+        self._tree_index: int = 0
+
+        # PERFORMANCE: Zuletzt angewendeter Validierungs-Stil (None/"ok"/"error"),
+        # damit unveränderte Zustände nicht erneut gestylt werden (MainWindow)
+        self._last_row_style_state: Optional[str] = None
+        self._last_text_style_state: Optional[str] = None
+
+        # Kategorie wurde abgehakt - beim erneuten Anhaken alle Werte an Kinder propagieren
+        # (PERFORMANCE: festes Attribut statt hasattr/delattr im Checkbox-Pfad)
+        self._was_unchecked: bool = False
+
         # UI initialisieren
         self._setup_ui()
 
@@ -226,6 +253,42 @@ class ZeichenTreeItem(QTreeWidgetItem):
                 # Rekursiv
                 child.propagate_params_to_children()
 
+    def propagate_and_refresh_children(
+        self,
+        update_widget_fn: Callable[['ZeichenTreeItem'], None]
+    ):
+        """
+        Propagiert Parameter an alle Kinder und aktualisiert deren Widgets
+
+        PERFORMANCE: Ein einziger Durchlauf statt propagate_params_to_children()
+        gefolgt von einem zweiten Durchlauf zur Widget-Aktualisierung.
+
+        Args:
+            update_widget_fn: Callback pro Kind (nach dem Setzen der Parameter)
+        """
+        if self.item_type == self.TYPE_ZEICHEN:
+            return
+
+        modus = self.params.modus
+        text = self.params.text
+
+        # Iterativ mit explizitem Stack (alle Nachfahren erhalten die Werte dieses Items)
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for i in range(node.childCount()):
+                child = node.child(i)
+                if not isinstance(child, ZeichenTreeItem):
+                    continue
+
+                child.params.modus = modus
+                child.params.text = text
+                child.params.inherited = True
+                update_widget_fn(child)
+
+                if child.item_type != self.TYPE_ZEICHEN:
+                    stack.append(child)
+
     def get_effective_params(self) -> ZeichenParameter:
         """
         Gibt effektive Parameter zurueck (mit Vererbung)
@@ -15,7 +15,8 @@ import logging
 import re
 import xml.etree.ElementTree as ET
 import os
-from datetime import datetime
+import time
+from functools import lru_cache
 
 from constants import (
     DEFAULT_ZEICHEN_DIR,
@@ -28,7 +29,8 @@ from constants import (
     BLANKO_S1_LINIEN,
     BLANKO_S1_LINIEN_STAERKE,
     BLANKO_S1_ZEICHEN_NAMEN,
-    AVAILABLE_MODI
+    AVAILABLE_MODI,
+    BLANKO_LOOKUP_CACHE_SIZE
 )
 
 
@@ -217,6 +219,7 @@ class SVGLoaderLocal:
             return []
 
     @staticmethod
+    @lru_cache(maxsize=BLANKO_LOOKUP_CACHE_SIZE)  # PERFORMANCE: wiederholte Abfragen pro Pfad
     def is_blanko_zeichen(svg_path: Path) -> bool:
         """
         Prüft, ob ein Pfad ein Blanko-Zeichen ist
@@ -271,6 +274,7 @@ class SVGLoaderLocal:
         return stem == BLANKO_S1_LINIEN_STAERKE
 
     @staticmethod
+    @lru_cache(maxsize=BLANKO_LOOKUP_CACHE_SIZE)  # PERFORMANCE: wiederholte Abfragen pro Pfad
     def get_blanko_modus(svg_path: Path) -> Optional[str]:
         """
         Extrahiert den Modus aus einem Blanko-Zeichen-Pfad
@@ -303,6 +307,7 @@ class SVGLoaderLocal:
         return None
 
     @staticmethod
+    @lru_cache(maxsize=BLANKO_LOOKUP_CACHE_SIZE)  # PERFORMANCE: wiederholte Abfragen pro Pfad
     def get_blanko_display_name(svg_path: Path) -> str:
         """
         Gibt den Anzeigenamen für ein Blanko-Zeichen zurück
@@ -364,7 +369,7 @@ class SVGLoaderLocal:
         Returns:
             Dict: {kategorie: [svg_paths]} - Alle Kategorien mit ihren SVG-Dateien
         """
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()  # PERFORMANCE: monotone Zeitmessung
         categories = {}
 
         # os.walk() - ein einziger Durchlauf durch gesamte Verzeichnisstruktur
@@ -419,7 +424,7 @@ class SVGLoaderLocal:
             len(AVAILABLE_MODI), 3, len(blanko_paths)))
 
         # Zeitmessung
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
         total_svgs = sum(len(svgs) for svgs in categories.values())
         self.logger.info("Kategorien gescannt: {} mit {} SVGs in {:.2f}s".format(
             len(categories), total_svgs, elapsed
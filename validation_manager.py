@@ -54,6 +54,9 @@ class ValidationManager:
         """Initialisiert ValidationManager"""
         self.logger = LoggingManager().get_logger(__name__)
 
+        # PERFORMANCE: Wiederverwendete Warn-MessageBox (lazy, siehe show_validation_warning)
+        self._warning_box: Optional[QMessageBox] = None
+
     def validate_grafik_size(
         self,
         hoehe: float,
@@ -120,93 +123,173 @@ class ValidationManager:
         Returns:
             tuple: (is_valid, error_message)
         """
+        return self.validate_text_lengths_batch(
+            [(text, modus, item_name)],
+            zeichen_hoehe_mm=zeichen_hoehe_mm,
+            zeichen_breite_mm=zeichen_breite_mm,
+            sicherheitsabstand_mm=sicherheitsabstand_mm,
+            font_size=font_size
+        )[0]
+
+    def validate_text_lengths_batch(
+        self,
+        entries: List[Tuple[str, str, str]],
+        zeichen_hoehe_mm: float,
+        zeichen_breite_mm: float,
+        sicherheitsabstand_mm: float,
+        font_size: Optional[int] = None
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Validiert mehrere Texte mit gemeinsamer Geometrie (Batch-Variante)
+
+        PERFORMANCE: TextOverlay, RuntimeConfig und sicherer Bereich werden nur
+        einmal pro Batch ermittelt. Text-Höhe/-Breite werden je (modus, text)
+        nur einmal gemessen, auch wenn mehrere Zeichen denselben Text haben.
+
+        Args:
+            entries: Liste von (text, modus, item_name)
+            zeichen_hoehe_mm: Zeichengröße Höhe
+            zeichen_breite_mm: Zeichengröße Breite
+            sicherheitsabstand_mm: Sicherheitsabstand (Grafik/Text zum fertigen Rand)
+            font_size: Schriftgröße in pt (None = aus RuntimeConfig)
+
+        Returns:
+            list: (is_valid, error_message) pro Eintrag, gleiche Reihenfolge wie entries
+        """
         if not TEXT_LENGTH_VALIDATION_ENABLED:
-            return True, None
+            return [(True, None)] * len(entries)
 
         # FIXED: Font-Size aus RuntimeConfig wenn nicht übergeben
         if font_size is None:
             font_size = get_config().font_size
 
-        # Berechne tatsächliche Text-Höhe
         try:
             from text_overlay import TextOverlayPlaceholder, ZeichenConfig
 
             # FIXED: DPI aus RuntimeConfig verwenden
             runtime_cfg = get_config()
+            overlay = TextOverlayPlaceholder()
+        except Exception as e:
+            self.logger.error(f"Fehler bei Text-Validierung: {e}")
+            return [(True, None)] * len(entries)  # Bei Fehler durchlassen, nicht blockieren
+
+        # Verfügbarer Bereich im sicheren Bereich (für alle Einträge gleich)
+        sicherer_bereich_hoehe_mm = zeichen_hoehe_mm - (2 * sicherheitsabstand_mm)
+        sicherer_bereich_breite_mm = zeichen_breite_mm - (2 * sicherheitsabstand_mm)
+
+        # (modus, text) -> (text_hoehe_mm, text_breite_mm)
+        measurements = {}
+        results = []
+
+        for text, modus, item_name in entries:
+            try:
+                key = (modus, text)
+                measured = measurements.get(key)
+                if measured is None:
+                    # Erstelle temporäre Config
+                    config = ZeichenConfig(
+                        zeichen_id="validation_temp",
+                        svg_path=Path("temp.svg"),
+                        modus=modus,
+                        ov_name=text if modus in ["ov_staerke", "ort_staerke"] else None,
+                        freitext=text if modus in ["freitext", "dateiname"] else None,
+                        font_size=font_size,
+                        dpi=runtime_cfg.export_dpi
+                    )
+
+                    # Berechne Text-Höhe (inkl. Offsets!) und Text-Breite
+                    measured = (
+                        overlay.calculate_text_height_mm(config),
+                        overlay.calculate_text_width_mm(config)
+                    )
+                    measurements[key] = measured
+
+                text_hoehe_mm, text_breite_mm = measured
+                results.append(self._check_text_fits(
+                    text_hoehe_mm,
+                    text_breite_mm,
+                    sicherer_bereich_hoehe_mm,
+                    sicherer_bereich_breite_mm,
+                    item_name,
+                    runtime_cfg
+                ))
+
+            except Exception as e:
+                self.logger.error(f"Fehler bei Text-Validierung: {e}")
+                results.append((True, None))  # Bei Fehler durchlassen, nicht blockieren
+
+        return results
+
+    def _check_text_fits(
+        self,
+        text_hoehe_mm: float,
+        text_breite_mm: float,
+        sicherer_bereich_hoehe_mm: float,
+        sicherer_bereich_breite_mm: float,
+        item_name: str,
+        runtime_cfg
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Prüft gemessene Text-Abmessungen gegen den sicheren Bereich
 
-            # Erstelle temporäre Config
-            config = ZeichenConfig(
-                zeichen_id="validation_temp",
-                svg_path=Path("temp.svg"),
-                modus=modus,
-                ov_name=text if modus in ["ov_staerke", "ort_staerke"] else None,
-                freitext=text if modus in ["freitext", "dateiname"] else None,
-                font_size=font_size,
-                dpi=runtime_cfg.export_dpi
+        Args:
+            text_hoehe_mm: Gemessene Text-Höhe (inkl. Offsets)
+            text_breite_mm: Gemessene Text-Breite
+            sicherer_bereich_hoehe_mm: Verfügbare Höhe
+            sicherer_bereich_breite_mm: Verfügbare Breite
+            item_name: Name des Items für Fehlermeldung
+            runtime_cfg: RuntimeConfig (Offsets für Fehlermeldung)
+
+        Returns:
+            tuple: (is_valid, error_message)
+        """
+        # NEW: Prüfe BREITE zuerst (kritischer!)
+        if text_breite_mm > sicherer_bereich_breite_mm:
+            error_msg = (
+                f"Text von '{item_name}' ist zu BREIT für den sicheren Bereich:\n\n"
+                f"  • Text-Breite: {text_breite_mm:.1f} mm\n"
+                f"  • Verfügbar: {sicherer_bereich_breite_mm:.1f} mm\n"
+                f"  • Überschreitung: {text_breite_mm - sicherer_bereich_breite_mm:.1f} mm\n\n"
+                f"ACHTUNG: Text läuft über den Canvas hinaus!\n\n"
+                f"Lösungen:\n"
+                f"  1. Text KÜRZEN (empfohlen)\n"
+                f"  2. Schriftgröße reduzieren\n"
+                f"  3. Zeichengröße erhöhen"
             )
+            return False, error_msg
 
-            # Berechne Text-Höhe (inkl. Offsets!)
-            overlay = TextOverlayPlaceholder()
-            text_hoehe_mm = overlay.calculate_text_height_mm(config)
-
-            # NEW: Berechne Text-Breite
-            text_breite_mm = overlay.calculate_text_width_mm(config)
-
-            # Verfügbare Höhe im sicheren Bereich
-            sicherer_bereich_hoehe_mm = zeichen_hoehe_mm - (2 * sicherheitsabstand_mm)
-            sicherer_bereich_breite_mm = zeichen_breite_mm - (2 * sicherheitsabstand_mm)
-
-            # NEW: Prüfe BREITE zuerst (kritischer!)
-            if text_breite_mm > sicherer_bereich_breite_mm:
-                error_msg = (
-                    f"Text von '{item_name}' ist zu BREIT für den sicheren Bereich:\n\n"
-                    f"  • Text-Breite: {text_breite_mm:.1f} mm\n"
-                    f"  • Verfügbar: {sicherer_bereich_breite_mm:.1f} mm\n"
-                    f"  • Überschreitung: {text_breite_mm - sicherer_bereich_breite_mm:.1f} mm\n\n"
-                    f"ACHTUNG: Text läuft über den Canvas hinaus!\n\n"
-                    f"Lösungen:\n"
-                    f"  1. Text KÜRZEN (empfohlen)\n"
-                    f"  2. Schriftgröße reduzieren\n"
-                    f"  3. Zeichengröße erhöhen"
-                )
-                return False, error_msg
-
-            # Prüfe HÖHE
-            if text_hoehe_mm > sicherer_bereich_hoehe_mm:
-                error_msg = (
-                    f"Text von '{item_name}' ist zu HOCH für den sicheren Bereich:\n\n"
-                    f"  • Text-Höhe: {text_hoehe_mm:.1f} mm\n"
-                    f"  • Verfügbar: {sicherer_bereich_hoehe_mm:.1f} mm\n"
-                    f"  • Überschreitung: {text_hoehe_mm - sicherer_bereich_hoehe_mm:.1f} mm\n\n"
-                    f"Hinweis: Text-Höhe beinhaltet bereits die Offsets:\n"
-                    f"  - Grafik↔Text: {runtime_cfg.abstand_grafik_text_mm:.1f} mm\n"
-                    f"  - Text↔Sicherheitsrand: {runtime_cfg.text_bottom_offset_mm:.1f} mm\n\n"
-                    f"Lösungen:\n"
-                    f"  1. Text kürzen\n"
-                    f"  2. Schriftgröße reduzieren\n"
-                    f"  3. Zeichengröße erhöhen"
-                )
-                return False, error_msg
-
-            # NEW: Warnung bei knapper Breite (< 5mm Reserve)
-            breite_reserve = sicherer_bereich_breite_mm - text_breite_mm
-            if breite_reserve < 5.0:
-                self.logger.warning(
-                    f"'{item_name}': Text ist sehr breit! "
-                    f"Nur {breite_reserve:.1f}mm Reserve"
-                )
-
-            # Warnung bei knappem Platz (< 5mm für Grafik)
-            remaining_space = sicherer_bereich_hoehe_mm - text_hoehe_mm
-            if remaining_space < 5.0:
-                self.logger.warning(
-                    f"'{item_name}': Wenig Platz für Grafik! "
-                    f"Nur {remaining_space:.1f}mm verfügbar"
-                )
+        # Prüfe HÖHE
+        if text_hoehe_mm > sicherer_bereich_hoehe_mm:
+            error_msg = (
+                f"Text von '{item_name}' ist zu HOCH für den sicheren Bereich:\n\n"
+                f"  • Text-Höhe: {text_hoehe_mm:.1f} mm\n"
+                f"  • Verfügbar: {sicherer_bereich_hoehe_mm:.1f} mm\n"
+                f"  • Überschreitung: {text_hoehe_mm - sicherer_bereich_hoehe_mm:.1f} mm\n\n"
+                f"Hinweis: Text-Höhe beinhaltet bereits die Offsets:\n"
+                f"  - Grafik↔Text: {runtime_cfg.abstand_grafik_text_mm:.1f} mm\n"
+                f"  - Text↔Sicherheitsrand: {runtime_cfg.text_bottom_offset_mm:.1f} mm\n\n"
+                f"Lösungen:\n"
+                f"  1. Text kürzen\n"
+                f"  2. Schriftgröße reduzieren\n"
+                f"  3. Zeichengröße erhöhen"
+            )
+            return False, error_msg
 
-        except Exception as e:
-            self.logger.error(f"Fehler bei Text-Validierung: {e}")
-            return True, None  # Bei Fehler durchlassen, nicht blockieren
+        # NEW: Warnung bei knapper Breite (< 5mm Reserve)
+        breite_reserve = sicherer_bereich_breite_mm - text_breite_mm
+        if breite_reserve < 5.0:
+            self.logger.warning(
+                f"'{item_name}': Text ist sehr breit! "
+                f"Nur {breite_reserve:.1f}mm Reserve"
+            )
+
+        # Warnung bei knappem Platz (< 5mm für Grafik)
+        remaining_space = sicherer_bereich_hoehe_mm - text_hoehe_mm
+        if remaining_space < 5.0:
+            self.logger.warning(
+                f"'{item_name}': Wenig Platz für Grafik! "
+                f"Nur {remaining_space:.1f}mm verfügbar"
+            )
 
         return True, None
 
@@ -278,12 +361,27 @@ class ValidationManager:
         """
         Zeigt Validierungs-Warnung als MessageBox
 
+        PERFORMANCE: Die MessageBox wird beim ersten Aufruf erstellt und danach
+        wiederverwendet (nur Titel/Text setzen statt Neuaufbau inkl. Styling).
+
         Args:
             parent: Parent-Widget
             title: Titel der MessageBox
             message: Fehlermeldung
         """
-        QMessageBox.warning(parent, title, message)
+        box = self._warning_box
+        if box is None:
+            box = QMessageBox(parent)
+            box.setIcon(QMessageBox.Icon.Warning)
+            box.setStandardButtons(QMessageBox.StandardButton.Ok)
+            self._warning_box = box
+        elif box.parent() is not parent:
+            # Fensterflags beibehalten (setParent ohne Flags macht ein Child-Widget daraus)
+            box.setParent(parent, box.windowFlags())
+
+        box.setWindowTitle(title)
+        box.setText(message)
+        box.exec()
 
     def show_grafik_size_exceeded_warning(
         self,